@@ -1,28 +1,54 @@
-from graphviz import Digraph
-
-# Create a flowchart for slug test method selection
-dot = Digraph("SlugTestMethods", format="png")
-dot.attr(rankdir="TB", size="8")
-
-# Nodes
-dot.node("A", "Slug Test Data", shape="box", style="rounded,filled", fillcolor="lightblue")
-dot.node("B", "Aquifer Type / Well Conditions?", shape="diamond", style="filled", fillcolor="lightgrey")
-
-# Methods
-dot.node("C1", "Hvorslev (1951)\nLow-K aquifers", shape="box", style="rounded,filled", fillcolor="lightyellow")
-dot.node("C2", "Bouwer & Rice (1976)\nUnconfined, partial penetration", shape="box", style="rounded,filled", fillcolor="lightyellow")
-dot.node("C3", "Cooper–Bredehoeft–Papadopulos (1967)\nConfined, wellbore storage", shape="box", style="rounded,filled", fillcolor="lightyellow")
-dot.node("C4", "Butler (1998+) / Curve Fitting\nAnisotropy, modern extensions", shape="box", style="rounded,filled", fillcolor="lightyellow")
-
-# Edges
-dot.edge("A", "B")
-dot.edge("B", "C1", label="Low-K")
-dot.edge("B", "C2", label="Unconfined,\npartial screen")
-dot.edge("B", "C3", label="Confined,\nwell storage")
-dot.edge("B", "C4", label="Complex/\nmodern analysis")
-
-# Render to file
-output_path = "slug_test_methods_flowchart"
-dot.render(output_path)
-
-output_path + ".png"
+import hashlib
+import os
+
+
+def build_graph():
+    """Create a flowchart for slug test method selection."""
+    from graphviz import Digraph
+
+    dot = Digraph("SlugTestMethods", format="png")
+    dot.attr(rankdir="TB", size="8")
+
+    # Nodes
+    dot.node("A", "Slug Test Data", shape="box", style="rounded,filled", fillcolor="lightblue")
+    dot.node("B", "Aquifer Type / Well Conditions?", shape="diamond", style="filled", fillcolor="lightgrey")
+
+    # Methods
+    dot.node("C1", "Hvorslev (1951)\nLow-K aquifers", shape="box", style="rounded,filled", fillcolor="lightyellow")
+    dot.node("C2", "Bouwer & Rice (1976)\nUnconfined, partial penetration", shape="box", style="rounded,filled", fillcolor="lightyellow")
+    dot.node("C3", "Cooper–Bredehoeft–Papadopulos (1967)\nConfined, wellbore storage", shape="box", style="rounded,filled", fillcolor="lightyellow")
+    dot.node("C4", "Butler (1998+) / Curve Fitting\nAnisotropy, modern extensions", shape="box", style="rounded,filled", fillcolor="lightyellow")
+
+    # Edges
+    dot.edge("A", "B")
+    dot.edge("B", "C1", label="Low-K")
+    dot.edge("B", "C2", label="Unconfined,\npartial screen")
+    dot.edge("B", "C3", label="Confined,\nwell storage")
+    dot.edge("B", "C4", label="Complex/\nmodern analysis")
+    return dot
+
+
+def render_chart(output_path="slug_test_methods_flowchart"):
+    """Render the flowchart, skipping the render if the graph is unchanged.
+
+    The sha256 of the DOT source is stored next to the image in a ``.hash``
+    sidecar file; when it matches and the image exists, ``dot`` is not run.
+    """
+    dot = build_graph()
+    png_file = output_path + ".png"
+    hash_file = output_path + ".hash"
+    digest = hashlib.sha256(dot.source.encode("utf-8")).hexdigest()
+
+    if os.path.exists(png_file) and os.path.exists(hash_file):
+        with open(hash_file) as f:
+            if f.read().strip() == digest:
+                return png_file
+
+    dot.render(output_path)
+    with open(hash_file, "w") as f:
+        f.write(digest)
+    return png_file
+
+
+if __name__ == "__main__":
+    render_chart()
@@ -1,13 +1,43 @@
 """Top-level package for pyAqTest."""
 
+import importlib
+
 __author__ = """Ayman H. Alzraiee"""
 __email__ = "aalzraiee@gsi-net.net"
 __version__ = "0.1.0"
 
-from .aquifer import *
-from .wells import *
-from .aquifer_test import *
-from .slug_tests import *
-from .pump_tests import *
-from .batch_processing import *
-from . import readers
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in scipy/matplotlib until an analysis class is used.
+_LAZY_ATTRS = {
+    "VALID_AQUIFER_TYPES": "aquifer",
+    "Aquifer": "aquifer",
+    "VALID_WELL_TYPES": "wells",
+    "Well": "wells",
+    "PumpingWell": "wells",
+    "ObservationWell": "wells",
+    "SlugWell": "wells",
+    "VALID_AQUIFER_TEST_TYPES": "aquifer_test",
+    "AquiferTestBase": "aquifer_test",
+    "catch_data_issues": "slug_tests",
+    "Bouwer_Rice_1976": "slug_tests",
+    "Butler_2003": "slug_tests",
+    "Batch_Processing": "batch_processing",
+    "run_batch": "batch_processing",
+}
+_LAZY_SUBMODULES = ("readers",)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_LAZY_SUBMODULES))
@@ -15,21 +15,49 @@ except Exception:
 
 import dash
 import dash_bootstrap_components as dbc
+import flask
+from plotly.io.json import to_json_plotly
 
 from dashboard import create_main_layout, register_callbacks
 
-def create_app():
-    """Create and configure the main Dash app"""
+# Static files (logo, stylesheets) live in the repository-level assets folder
+ASSETS_FOLDER = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "assets")
+)
+
+def cache_layout(app):
+    """Serve the static layout from JSON serialized once, on first request.
+
+    Dash re-serializes app.layout for every page load; the layout here never
+    changes after startup, so the serialized payload is reused.
+    """
+    layout_path = app.config.routes_pathname_prefix + "_dash-layout"
+    cached = {}
+
+    @app.server.before_request
+    def _serve_cached_layout():
+        if flask.request.path != layout_path:
+            return None
+        if "body" not in cached:
+            cached["body"] = to_json_plotly(app.layout)
+        return flask.Response(cached["body"], mimetype="application/json")
+
+
+def create_app(theme="BOOTSTRAP"):
+    """Create and configure the main Dash app
+
+    theme is the name of a dash-bootstrap-components theme, e.g. "LUX".
+    """
     
-    # Initialize the app with default Bootstrap theme
+    # Initialize the app with the requested Bootstrap theme
     app = dash.Dash(
         __name__,
         external_stylesheets=[
-            dbc.themes.BOOTSTRAP,  # Default Bootstrap theme
+            getattr(dbc.themes, theme.upper()),  # Bootstrap theme
             "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css"  # Font Awesome icons
         ],
         suppress_callback_exceptions=True,
-        assets_folder='assets'
+        assets_folder=ASSETS_FOLDER
     )
     
     # Set app title
@@ -39,19 +67,20 @@ def create_app():
     
     # Set the layout
     app.layout = create_main_layout()
+    cache_layout(app)
     
     # Register all callbacks
     register_callbacks(app)
     
     return app
 
-def main():
+def main(theme="BOOTSTRAP"):
     """Main function to run the app"""
     # Example: Read INI file and add to data storage
     # You can call this function with any INI filename
     # read_ini_file("config.ini")
     
-    app = create_app()
+    app = create_app(theme=theme)
     
     # Run the app
     app.run(
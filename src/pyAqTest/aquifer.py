@@ -6,103 +6,172 @@ It includes methods for initializing the aquifer, validating its properties,
 and calculating transmissivity and storage coefficient.
 """
 
-VALID_AQUIFER_TYPES = ["unconfined", "confined", "semi-confined"]
+import sys
+from dataclasses import dataclass, field
+
+# interned so equality checks against interned aquifer types compare pointers
+_UNCONFINED = sys.intern("unconfined")
+_CONFINED = sys.intern("confined")
+_SEMI_CONFINED = sys.intern("semi-confined")
+
+VALID_AQUIFER_TYPES = frozenset((_UNCONFINED, _CONFINED, _SEMI_CONFINED))
+VALID_LENGTH_UNITS = frozenset(("m", "ft"))
+VALID_TIME_UNITS = frozenset(("s", "min", "h"))
+
+# attributes the cached storage coefficient depends on
+_STORAGE_COEFFICIENT_INPUTS = (
+    "aquifer_type",
+    "specific_yield",
+    "specific_storage",
+    "saturated_thickness",
+)
+# attributes the cached transmissivity depends on
+_TRANSMISSIVITY_INPUTS = ("radial_conductivity", "saturated_thickness")
+
+
+def _unconfined_storage_coefficient(aquifer) -> float:
+    if aquifer.specific_yield is None:
+        return None
+    return aquifer.specific_yield * aquifer.saturated_thickness
 
 
-class Aquifer:
+def _confined_storage_coefficient(aquifer) -> float:
+    if aquifer.specific_storage is None:
+        return None
+    return aquifer.specific_storage * aquifer.saturated_thickness
 
-    def __init__(
-        self,
-        name: str,
-        aquifer_type: str,
-        ground_surface_elevation: float,
-        saturated_thickness: float,
-        water_table_depth: float,
-        radial_conductivity: float = None,
-        vertical_conductivity: float = None,
-        specific_yield: float = None,
-        specific_storage: float = None,
-        anisotropy: float = 1.0,
-        length_unit: str = None,
-        time_unit: str = None,
-    ) -> None:
-        """
-        Initialize an Aquifer object.
-
-        Parameters:
-        aquifer_id (str): Unique identifier for the aquifer.
-        aquifer_type (str): Type of the aquifer (e.g., "unconfined", "confined", "semi-confined").
-        ground_surface_elevation (float): Elevation of the ground surface.
-        saturated_thickness (float): Saturated thickness of the aquifer.
-        water_table_depth (float): Depth to the groundwater table.
-        radial_conductivity (float): Radial hydraulic conductivity of the aquifer.
-        vertical_conductivity (float): Vertical hydraulic conductivity of the aquifer.
-        specific_yield (float): Specific yield (Sy) of the aquifer.
-        specific_storage (float): Specific storage (Ss) of the aquifer.
-        anisotropy (float): Ratio of horizontal to vertical hydraulic conductivity.
 
-        """
-        # required properties
-        self.name = name
-        self.aquifer_type = aquifer_type
-        self.saturated_thickness = saturated_thickness
-        self.water_table_depth = water_table_depth
-        self.anisotropy = anisotropy
-        self.ground_surface_elevation = ground_surface_elevation
-        self.length_unit = length_unit
-        self.time_unit = time_unit
+# storage coefficient rule for each aquifer type
+_STORAGE_COEFFICIENT_RULES = {
+    _UNCONFINED: _unconfined_storage_coefficient,
+    _CONFINED: _confined_storage_coefficient,
+    _SEMI_CONFINED: _confined_storage_coefficient,
+}
+
+
+def _format_optional(value, unit=""):
+    """Format an optional property with three decimals, or 'None' if unset."""
+    if value is None:
+        return "None"
+    return f"{value:.3f}{unit}"
+
+
+@dataclass(slots=True, eq=False)
+class Aquifer:
+    """
+    Aquifer properties for pumping/slug test analysis.
+
+    Parameters:
+    name (str): Name of the aquifer.
+    aquifer_type (str): Type of the aquifer (e.g., "unconfined", "confined", "semi-confined").
+    ground_surface_elevation (float): Elevation of the ground surface.
+    saturated_thickness (float): Saturated thickness of the aquifer.
+    water_table_depth (float): Depth to the groundwater table.
+    radial_conductivity (float): Radial hydraulic conductivity of the aquifer.
+    vertical_conductivity (float): Vertical hydraulic conductivity of the aquifer.
+    specific_yield (float): Specific yield (Sy) of the aquifer.
+    specific_storage (float): Specific storage (Ss) of the aquifer.
+    anisotropy (float): Ratio of horizontal to vertical hydraulic conductivity.
+    length_unit (str): Length unit, 'm' or 'ft'.
+    time_unit (str): Time unit, 's', 'min', or 'h'.
+    """
+
+    # required properties
+    name: str
+    aquifer_type: str
+    ground_surface_elevation: float
+    saturated_thickness: float
+    water_table_depth: float
+    # optional properties
+    radial_conductivity: float = None
+    vertical_conductivity: float = None
+    specific_yield: float = None
+    specific_storage: float = None
+    anisotropy: float = 1.0
+    length_unit: str = None
+    time_unit: str = None
+    # cached derived values
+    _storage_coefficient: float = field(default=None, init=False, repr=False, compare=False)
+    _transmissivity: float = field(default=None, init=False, repr=False, compare=False)
+
+    _STR_TMPL = (
+        "===========================================================\n"
+        "Aquifer Name: {name}\n"
+        "Aquifer Type: {aquifer_type}\n"
+        "Ground Surface Elevation: {ground_surface_elevation:.2f} m\n"
+        "Saturated Thickness: {saturated_thickness:.2f} m\n"
+        "Depth to Water Table: {water_table_depth:.2f} m\n"
+        "Radial Conductivity: {radial_conductivity}\n"
+        "Vertical Conductivity: {vertical_conductivity}\n"
+        "Storage Coefficient: {storage_coefficient}\n"
+        "Specific Yield: {specific_yield}\n"
+        "Specific Storage: {specific_storage}\n"
+        "Hydraulic Conductivity Anisotropy Ratio: {anisotropy:.3f}\n"
+        "===========================================================\n"
+    )
+
+    def __post_init__(self) -> None:
+        if isinstance(self.aquifer_type, str):
+            # str() so that str subclasses such as numpy.str_ can be interned
+            self.aquifer_type = sys.intern(str(self.aquifer_type))
         self.set_default_values()
         self.validate_required_properties()
 
-        # optional properties
-        self.radial_conductivity = radial_conductivity
-        self.vertical_conductivity = vertical_conductivity
-        self.specific_yield = specific_yield
-        self.specific_storage = specific_storage
+    @classmethod
+    def from_dataframe(cls, df) -> list:
+        """
+        Create one Aquifer per row of a DataFrame.
+
+        Column names must match the constructor arguments. The positive-value
+        checks of validate_positive_values are applied to whole columns at
+        once before any object is constructed.
+        """
+        invalid = (df["saturated_thickness"] <= 0) | (df["water_table_depth"] < 0)
+        if "anisotropy" in df.columns:
+            invalid |= df["anisotropy"] < 0
+        if invalid.any():
+            raise ValueError(
+                f"Error: Invalid aquifer properties in rows {df.index[invalid].tolist()}. "
+                "Saturated thickness must be positive, depth to groundwater table "
+                "and anisotropy ratio must be >= 0."
+            )
+        return [cls(**row) for row in df.to_dict("records")]
+
+    def __setattr__(self, name, value) -> None:
+        # object.__setattr__ rather than super(): dataclass(slots=True)
+        # replaces the class, which breaks the zero-argument super() cell
+        object.__setattr__(self, name, value)
+        # invalidate cached derived values when one of their inputs changes
+        if name in _STORAGE_COEFFICIENT_INPUTS:
+            object.__setattr__(self, "_storage_coefficient", None)
+        if name in _TRANSMISSIVITY_INPUTS:
+            object.__setattr__(self, "_transmissivity", None)
 
     def __str__(self) -> str:
         # todo: fix all units
-        return (
-            "===========================================================\n"
-            f"Aquifer Name: {self.name}\n"
-            f"Aquifer Type: {self.aquifer_type}\n"
-            f"Ground Surface Elevation: {self.ground_surface_elevation:.2f} m\n"
-            f"Saturated Thickness: {self.saturated_thickness:.2f} m\n"
-            f"Depth to Water Table: {self.water_table_depth:.2f} m\n"
-            + (
-                f"Radial Conductivity: {self.radial_conductivity:.3f} m/s\n"
-                if self.radial_conductivity is not None
-                else "Radial Conductivity: None\n"
-            )
-            + (
-                f"Vertical Conductivity: {self.vertical_conductivity:.3f} m/s\n"
-                if self.vertical_conductivity is not None
-                else "Vertical Conductivity: None\n"
-            )
-            + (
-                f"Storage Coefficient: {self.storage_coefficient:.3f}\n"
-                if self.storage_coefficient is not None
-                else "Storage Coefficient: None\n"
-            )
-            + (
-                f"Specific Yield: {self.specific_yield:.3f}\n"
-                if self.specific_yield is not None
-                else "Specific Yield: None\n"
-            )
-            + (
-                f"Specific Storage: {self.specific_storage:.3f} 1/m\n"
-                if self.specific_storage is not None
-                else "Specific Storage: None\n"
-            )
-            + f"Hydraulic Conductivity Anisotropy Ratio: {self.anisotropy:.3f}\n"
-            "===========================================================\n"
+        return self._STR_TMPL.format_map(
+            {
+                "name": self.name,
+                "aquifer_type": self.aquifer_type,
+                "ground_surface_elevation": self.ground_surface_elevation,
+                "saturated_thickness": self.saturated_thickness,
+                "water_table_depth": self.water_table_depth,
+                "radial_conductivity": _format_optional(self.radial_conductivity, " m/s"),
+                "vertical_conductivity": _format_optional(
+                    self.vertical_conductivity, " m/s"
+                ),
+                "storage_coefficient": _format_optional(self.storage_coefficient),
+                "specific_yield": _format_optional(self.specific_yield),
+                "specific_storage": _format_optional(self.specific_storage, " 1/m"),
+                "anisotropy": self.anisotropy,
+            }
         )
 
     # add a method to validate aquifer type
     def validate_aquifer_type(self) -> None:
         if self.aquifer_type not in VALID_AQUIFER_TYPES:
             raise ValueError(
-                f"Invalid aquifer type: {self.aquifer_type}. Valid types are: {VALID_AQUIFER_TYPES}."
+                f"Invalid aquifer type: {self.aquifer_type}. Valid types are: {', '.join(sorted(VALID_AQUIFER_TYPES))}."
             )
         return None
 
@@ -110,25 +179,23 @@ class Aquifer:
 
     @property
     def storage_coefficient(self) -> float:
+        if self._storage_coefficient is None:
+            self._storage_coefficient = self._compute_storage_coefficient()
+        return self._storage_coefficient
 
-        if self.aquifer_type == "unconfined":
-            if self.specific_yield is None:
-                return None
-            self.storage_coefficient = self.specific_yield * self.saturated_thickness
-        elif self.aquifer_type in ["confined", "semi-confined"]:
-            if self.specific_storage is None:
-                return None
-            self.storage_coefficient = self.specific_storage * self.saturated_thickness
-        else:
+    def _compute_storage_coefficient(self) -> float:
+        compute = _STORAGE_COEFFICIENT_RULES.get(self.aquifer_type)
+        if compute is None:
             raise ValueError(
                 f"Invalid aquifer type: {self.aquifer_type}. Cannot calculate storage coefficient."
             )
-        return self.storage_coefficient
+        return compute(self)
 
     @property
     def transmissivity(self) -> float:
-        transmissivity = self.radial_conductivity * self.saturated_thickness
-        return transmissivity
+        if self._transmissivity is None:
+            self._transmissivity = self.radial_conductivity * self.saturated_thickness
+        return self._transmissivity
 
     # apply default valuees for optional properties
     def set_default_values(self) -> None:
@@ -143,23 +210,26 @@ class Aquifer:
 
     # check if the aquifer has the required properties
     def validate_required_properties(self) -> bool:
-        required_properties = [
-            "aquifer_type",
-            "ground_surface_elevation",
-            "saturated_thickness",
-            "water_table_depth",
-        ]
         # Check if all required properties are not none
-        for prop in required_properties:
-            if getattr(self, prop) is None:
-                raise ValueError(f"Error: {prop} is not set.")
+        missing = [
+            prop
+            for prop, value in (
+                ("aquifer_type", self.aquifer_type),
+                ("ground_surface_elevation", self.ground_surface_elevation),
+                ("saturated_thickness", self.saturated_thickness),
+                ("water_table_depth", self.water_table_depth),
+            )
+            if value is None
+        ]
+        if missing:
+            raise ValueError(f"Error: {', '.join(missing)} is not set.")
 
         # valide length and time units
-        if self.length_unit not in ["m", "ft"]:
+        if self.length_unit not in VALID_LENGTH_UNITS:
             raise ValueError(
                 f"Error: Invalid length unit '{self.length_unit}'. Must be 'm' or 'ft'."
             )
-        if self.time_unit not in ["s", "min", "h"]:
+        if self.time_unit not in VALID_TIME_UNITS:
             raise ValueError(
                 f"Error: Invalid time unit '{self.time_unit}'. Must be 's', 'min', or 'h'."
             )
@@ -1,17 +1,39 @@
 import os
 import shutil
 import configparser
+import functools
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from time import time_ns
 from tqdm import tqdm
 
+import matplotlib
+import numpy as np
 import pandas as pd
 from pyAqTest import Aquifer, SlugWell, Bouwer_Rice_1976, Butler_2003
 
 from .settings import Batch_Settings
-from .utils import FIG_SAVE_DPI, insitu_to_csv
+from .utils import FIG_SAVE_DPI, get_static_level, insitu_to_csv
 from .report import gererate_report, make_schematic_plot
 from datetime import date
 
+# batch runs only write figures to files; slug_tests and utils select TkAgg
+# when imported, so switch to the non-GUI backend once they are loaded
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib import image as mpl_image  # noqa: E402
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+
+# the multithreaded Arrow parser is used for CSV reads when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401
+
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
 # from .report import generate_html_report
 
 """
@@ -32,6 +54,266 @@ The standard format is csv file that should include the following columns:
 
 """
 
+# numeric fields of the batch table
+_BATCH_DTYPES = {
+    "aquifer_thickness": "float64",
+    "water_table_depth": "float64",
+    "anisotropy": "float64",
+    "well_radius": "float64",
+    "casing_radius": "float64",
+    "screen_length": "float64",
+    "screen_top_depth": "float64",
+    "slug_volume": "float64",
+}
+
+
+def _batch_to_tests(df):
+    """
+    Turn the batch table (one row per field) into one row per test.
+
+    The batch file stores fields as rows, so the numeric dtypes can only be
+    applied column-wise once the table is transposed. For the same reason the
+    file is not read in row chunks: a chunk would hold some fields of every
+    test rather than whole tests.
+    """
+    df = df.set_index("field").transpose()
+    return df.astype({k: v for k, v in _BATCH_DTYPES.items() if k in df.columns})
+
+
+def _discard_folder(folder, keep=()):
+    """
+    Remove a previous output folder without waiting for the deletion.
+
+    The folder is renamed aside, which is a single atomic operation, and the
+    renamed tree is deleted on a background thread. The thread is not a
+    daemon, so the deletion completes before the interpreter exits.
+
+    Subfolders named in keep are moved into a fresh, otherwise empty folder.
+    """
+    if not os.path.exists(folder):
+        return
+    folder = os.path.normpath(folder)
+    # unique name so that a leftover from an interrupted run does not block the rename
+    old = f"{folder}.old-{os.getpid()}-{time_ns()}"
+    os.replace(folder, old)
+    kept = [name for name in keep if os.path.isdir(os.path.join(old, name))]
+    if kept:
+        os.makedirs(folder)
+        for name in kept:
+            os.replace(os.path.join(old, name), os.path.join(folder, name))
+    threading.Thread(target=shutil.rmtree, args=(old,), kwargs={"ignore_errors": True}).start()
+
+
+# a few frames only: every cached frame stays in memory until it is evicted
+@functools.lru_cache(maxsize=16)
+def _read_test_csv(path, mtime):
+    """Read a test data file; the modification time keys the cache so edited files are re-read."""
+    return pd.read_csv(path, engine=_CSV_ENGINE)
+
+
+def _load_test_csv(path):
+    """Read a test data file through the cache and return a private copy."""
+    # absolute paths so relative and absolute spellings share a cache entry
+    path = os.path.abspath(path)
+    return _read_test_csv(path, os.stat(path).st_mtime_ns).copy()
+
+
+def _results_table(results):
+    """Build the results table from per-test result dicts, test name first."""
+    df_results = pd.DataFrame(results)
+    cols = df_results.columns.tolist()
+    cols.insert(0, cols.pop(cols.index("test_name")))
+    return df_results.reindex(columns=cols)
+
+
+@functools.lru_cache(maxsize=None)
+def _pretty_label(name):
+    """Report label for a column name, e.g. 'screen_top_depth' -> 'Screen Top Depth'."""
+    return name.replace("_", " ").title()
+
+
+def _elapsed_seconds(timestamps, time_format):
+    """Parse timestamps with a known format and return seconds since the first one."""
+    t = pd.to_datetime(timestamps, format=time_format, cache=True)
+    t = t.to_numpy(dtype="datetime64[ns]").view("i8")
+    return (t - t[0]) / 1e9
+
+
+def _save_and_close(fig, fig_file):
+    """Save a fit figure as PNG and release it."""
+    try:
+        fig.savefig(fig_file, format="png", dpi=FIG_SAVE_DPI)
+    except Exception:
+        print(f"Saving figure {fig_file} failed")
+    finally:
+        plt.close(fig)
+
+
+def _render_and_close(fig):
+    """
+    Draw a fit figure at FIG_SAVE_DPI and release it.
+
+    Returns a copy of the RGBA pixels. Matplotlib figures must not be drawn
+    off the main thread while pyplot creates the next figure, but the pixels
+    can be PNG-encoded on any thread with _write_png.
+    """
+    try:
+        fig.set_dpi(FIG_SAVE_DPI)
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        return np.array(canvas.buffer_rgba())
+    finally:
+        plt.close(fig)
+
+
+def _write_png(pixels, fig_file):
+    """PNG-encode the pixels of a rendered figure."""
+    try:
+        mpl_image.imsave(
+            fig_file, pixels, format="png", origin="upper", dpi=FIG_SAVE_DPI
+        )
+    except Exception:
+        print(f"Saving figure {fig_file} failed")
+
+
+def _run_one(row, test_data, settings, io_pool=None, reraise=False):
+    """
+    Fit a slug test solution to the data of one test and save its fit plot.
+
+    Parameters:
+    row (dict): One test of the batch table, keyed by field name.
+    test_data (pd.DataFrame): Recovery data with time and head columns.
+    settings (dict): Folders, column names and units shared by all tests.
+    io_pool (ThreadPoolExecutor): If given, the fit figure is PNG-encoded on
+        this pool so the encoding overlaps with the next test's fit.
+    reraise (bool): Raise the error of a failed fit instead of returning None.
+
+    Returns:
+    dict: Fitting statistics and estimated parameters, or None if the fit failed.
+    """
+    test_id = row.get("test_id")
+    time_col = settings["time_col"]
+    head_col = settings["head_col"]
+    time_unit = settings["time_unit"]
+    length_unit = settings["length_unit"]
+
+    # todo: if pumping is implemented, we need to change this
+    aq = Aquifer(
+        name=row.get("aquifer_name"),
+        aquifer_type=row.get("aquifer_type"),
+        ground_surface_elevation=100.0,  # todo: do we need this?
+        saturated_thickness=row.get("aquifer_thickness"),
+        water_table_depth=row.get("water_table_depth"),
+        anisotropy=row.get("anisotropy"),
+        time_unit=time_unit,
+        length_unit=length_unit,
+    )
+    test_data[time_col] = _elapsed_seconds(test_data[time_col], settings["time_format"])
+    # contiguous float64 so the fitting routines take their fast paths
+    head = np.ascontiguousarray(test_data[head_col].to_numpy(), dtype=np.float64)
+    time = np.ascontiguousarray(test_data[time_col].to_numpy(), dtype=np.float64)
+
+    slug_well = SlugWell(
+        name=row.get("well_name"),
+        well_radius=row.get("well_radius"),
+        casing_radius=row.get("casing_radius"),
+        screen_length=row.get("screen_length"),
+        screen_top_depth=row.get("screen_top_depth"),
+        head=head,
+        time=time,
+        slug_volume=row.get("slug_volume", float("nan")),
+        is_recovery_data=True,  # rod
+        length_unit=length_unit,
+        time_unit=time_unit,
+    )
+
+    test_method = row.get("solution_method")
+    if test_method == "Bouwer_Rice":
+        slug_test = Bouwer_Rice_1976(
+            name=test_id, aquifer=aq, slug_well=slug_well
+        )
+    elif test_method == "Butler":
+        slug_test = Butler_2003(name=test_id, aquifer=aq, slug_well=slug_well)
+
+    try:
+        if "Static Level" in test_data.columns:
+            slug_test.static_level = test_data["Static Level"].values[0]
+        else:
+            slug_test.static_level = get_static_level(head)
+        slug_test.analyze()
+        fig_file = os.path.join(settings["plots_dir"], test_id + ".png")
+        if io_pool is None:
+            _save_and_close(slug_test.viz_fig, fig_file)
+        else:
+            io_pool.submit(_write_png, _render_and_close(slug_test.viz_fig), fig_file)
+
+        return {
+            **slug_test.fitting_statistics,
+            **slug_test.estimated_parameters,
+            "test_name": slug_test.name,
+        }
+    except:
+        if reraise:
+            raise
+        print(f"Fit failed for test {test_id}")
+        return None
+
+
+def _process_one_row(row, settings, io_pool=None):
+    """
+    Convert the In-Situ file of one batch test and analyze it.
+
+    Runs in a worker process, so all figure I/O happens here and only the
+    fitted results travel back to the parent.
+
+    Parameters:
+    row (dict): One test of the batch table, keyed by field name.
+    settings (dict): Folders, column names and units shared by all tests.
+    io_pool (ThreadPoolExecutor): Passed on to _run_one.
+
+    Returns:
+    tuple: (test_id, results) where results is a dict of fitting statistics
+    and estimated parameters, or None if the fit failed. None is returned
+    instead of a tuple when all values of the row are NA.
+    """
+    test_id = row.get("test_id")
+    # check if all values are na
+    if all(pd.isna(value) for value in row.values()):
+        print(f"All values are NA for test {test_id}")
+        return None
+
+    test_data_file = os.path.join(settings["raw_data_folder"], row.get("test_data_file"))
+    if not (os.path.exists(test_data_file)):
+        raise FileNotFoundError(
+            f"The test data file {test_data_file} does not exist."
+        )
+
+    csv_file = os.path.splitext(os.path.basename(test_data_file))[0] + ".csv"
+    csv_file = os.path.join(settings["processed_data_folder"], csv_file)
+    # skip the conversion when the CSV is newer than the raw file
+    if (
+        settings["force_conversion"]
+        or not os.path.exists(csv_file)
+        or os.path.getmtime(test_data_file) > os.path.getmtime(csv_file)
+    ):
+        insitu_to_csv(
+            insitu_file=test_data_file,
+            output_csv_file=csv_file,
+            fig_folder=settings["recovery_splits_folder"],
+            extract_recovery=True,
+        )
+
+    test_data = _load_test_csv(csv_file)
+    time_col = settings["time_col"]
+    head_col = settings["head_col"]
+    if time_col not in test_data.columns or head_col not in test_data.columns:
+        raise ValueError(
+            f"The test data file {test_data_file} does not contain '{time_col}' and '{head_col}' columns."
+        )
+
+    return test_id, _run_one(row, test_data, settings, io_pool)
+
+
 class Batch_Processing:
     def __init__(self, config_obj=None):
 
@@ -59,7 +341,7 @@ class Batch_Processing:
 
            
         self._populate_attributes()
-        self.df_batch = pd.read_csv(self.batch_data_file)
+        self.df_batch = pd.read_csv(self.batch_data_file, engine=_CSV_ENGINE)
 
     def _from_dict(self, config_dict):
         self.config = configparser.ConfigParser()
@@ -70,23 +352,35 @@ class Batch_Processing:
         # loop through the config and set attributes
         defaults = Batch_Settings()
         default_attrs = [a for a in dir(defaults) if not a.startswith("__")]
-        all_keys = []
-        for section in self.config.sections():
-            items = self.config[section].keys()
-            all_keys = all_keys + list(items)
+        # read (and interpolate) every config value once
+        items = [
+            (key, value.strip())
+            for section in self.config.sections()
+            for key, value in self.config.items(section)
+        ]
 
         for key in default_attrs:
             setattr(self, key, getattr(defaults, key))
 
-        self._settings_keys = all_keys
+        self._settings_keys = [key for key, _ in items]
 
-        for section in self.config.sections():
-            for key, value in self.config.items(section):
-                value = value.strip()
-                if not (value.lower() == "na"):
-                    setattr(self, key, value)
+        for key, value in items:
+            if value.lower() != "na":
+                setattr(self, key, value)
 
-    def run_batch(self):
+    def run_batch(self, force=None):
+        """
+        Analyze all tests of the batch and write the results to the output folder.
+
+        Parameters:
+        force (bool): Convert every In-Situ file again even if its CSV is up to
+            date. Defaults to the force_conversion setting.
+
+        Tests are analyzed serially unless max_workers is set above 1. Worker
+        processes are spawned on Windows and macOS, so a script that enables
+        them must call run_batch under ``if __name__ == "__main__":``. If the
+        pool breaks, the batch is analyzed again serially.
+        """
 
         if not (os.path.exists(self.batch_data_file)):
             raise FileNotFoundError(
@@ -97,159 +391,113 @@ class Batch_Processing:
         if "field" not in self.df_batch.columns:
             raise ValueError(f"The batch data file {self.batch_data_file} does not contain a column called 'field'.")
 
-        self.df_batch = self.df_batch.set_index("field").transpose()
+        self.df_batch = _batch_to_tests(self.df_batch)
 
-        if os.path.exists(self.output_folder):
-            shutil.rmtree(self.output_folder)
-        os.makedirs(self.output_folder)
+        if force is None:
+            force = str(self.force_conversion).strip().lower() == "true"
+        # converted test data is kept between runs unless a rebuild is forced
+        _discard_folder(
+            self.output_folder,
+            keep=() if force else ("processed_data", "recovery_splits"),
+        )
+        os.makedirs(self.output_folder, exist_ok=True)
         procced_data_folder = os.path.join(self.output_folder, "processed_data")
-        os.makedirs(procced_data_folder)
+        os.makedirs(procced_data_folder, exist_ok=True)
+        # create the shared output folders up front so that parallel workers
+        # do not race on creating them
+        recovery_splits_folder = os.path.join(self.output_folder, "recovery_splits")
+        plots_dir = os.path.join(self.output_folder, "fit_plots")
+        os.makedirs(recovery_splits_folder, exist_ok=True)
+        os.makedirs(plots_dir)
+        settings = {
+            "raw_data_folder": self.raw_data_folder,
+            "force_conversion": force,
+            "processed_data_folder": procced_data_folder,
+            "recovery_splits_folder": recovery_splits_folder,
+            "plots_dir": plots_dir,
+            "time_col": self.time_col,
+            "time_format": self.time_format,
+            "head_col": self.head_col,
+            "time_unit": self.time_unit,
+            "length_unit": self.length_unit,
+        }
+
+        # namedtuples from itertuples are not picklable, so workers get dicts
+        rows = [row._asdict() for row in self.df_batch.itertuples(index=False)]
+        max_workers = int(self.max_workers or 1)
         df_results = []
         failed_tests = []
-        with tqdm(total=len(self.df_batch), desc="Processing tests") as pbar:
-            for irow, row in self.df_batch.iterrows(): 
-                #ow =self.df_batch.iloc[192] 
-                test_id = row.get("test_id")
-                aquifer_name = row.get("aquifer_name")
-                pbar.set_postfix_str(f"Processing {test_id} in aquifer {aquifer_name}")
-                # check if all values are na
-                if row.isna().all():
-                    print(f"All values are NA for test {test_id}")
-                    continue
-
-                # if int(irow)> 4: # debug
-                #     pbar.update(1)
-                #     continue
-                
-                test_type = row.get("test_type")
-                aquifer_name = row.get("aquifer_name")
-                aquifer_type = row.get("aquifer_type")
-                aquifer_thickness = float(row.get("aquifer_thickness"))
-                water_table_depth = float(row.get("water_table_depth"))
-                anisotropy = float(row.get("anisotropy"))
-                well_name = row.get("well_name")
-                # if well_name in ['CER1_2_T1'] : # debug
-                #     vvv = 1
-                well_radius = float(row.get("well_radius"))
-                casing_radius = float(row.get("casing_radius"))
-                screen_length = float(row.get("screen_length"))
-                screen_top_depth = float(row.get("screen_top_depth"))
-                test_data_file = row.get("test_data_file")
-                slug_volume = float(row.get("slug_volume", pd.NA))
-                test_method = row.get("solution_method")
-
-                test_data_file = os.path.join(self.raw_data_folder, test_data_file)
-                if not (os.path.exists(test_data_file)):
-                    raise FileNotFoundError(
-                        f"The test data file {test_data_file} does not exist."
-                    )
-
-                csv_file = os.path.splitext(os.path.basename(test_data_file))[0] + ".csv"
-                csv_file = os.path.join(procced_data_folder, csv_file)
-                insitu_to_csv(
-                    insitu_file=test_data_file,
-                    output_csv_file=csv_file,
-                    fig_folder=os.path.join(self.output_folder, "recovery_splits"),
-                    extract_recovery=True,
-                )
-
-                test_data = pd.read_csv(csv_file)
-                time_col = self.time_col
-                head_col = self.head_col
-                if time_col not in test_data.columns or head_col not in test_data.columns:
-                    raise ValueError(
-                        f"The test data file {test_data_file} does not contain '{time_col}' and '{head_col}' columns."
-                    )
-
-                # todo: if pumping is implemented, we need to change this
-                aq = Aquifer(
-                    name=aquifer_name,
-                    aquifer_type=aquifer_type,
-                    ground_surface_elevation=100.0,  # todo: do we need this?
-                    saturated_thickness=aquifer_thickness,
-                    water_table_depth=water_table_depth,
-                    anisotropy=anisotropy,
-                    time_unit=self.time_unit,
-                    length_unit=self.length_unit,
-                )
-                test_data[time_col] = pd.to_datetime(test_data[time_col])
-                test_data[time_col] = (
-                    test_data[time_col] - test_data[time_col].values[0]
-                ).dt.total_seconds()
-
-                slug_well = SlugWell(
-                    name=well_name,
-                    well_radius=well_radius,
-                    casing_radius=casing_radius,
-                    screen_length=screen_length,
-                    screen_top_depth=screen_top_depth,
-                    head=test_data[head_col].values,
-                    time=test_data[time_col].values,
-                    slug_volume=slug_volume,
-                    is_recovery_data=True,  # rod
-                    length_unit=self.length_unit,
-                    time_unit=self.time_unit,
-                )
-
-                if test_method == "Bouwer_Rice":
-                    slug_test = Bouwer_Rice_1976(
-                        name=test_id, aquifer=aq, slug_well=slug_well
-                    )
-                elif test_method == "Butler":
-                    slug_test = Butler_2003(name=test_id, aquifer=aq, slug_well=slug_well)
-
+        with tqdm(total=len(rows), desc="Processing tests") as pbar:
+            if len(rows) > 1 and max_workers > 1:
                 try:
-                    slug_test.static_level = test_data["Static Level"].values[0]
-                    slug_test.analyze()
-                    plots_dir = os.path.join(self.output_folder, "fit_plots")
-                    if not (os.path.isdir(plots_dir)):
-                        os.makedirs(plots_dir)
-                    fig_file = os.path.join(plots_dir, test_id + ".png")
-                    slug_test.viz_fig.savefig(
-                        fig_file, format="png", dpi=FIG_SAVE_DPI
+                    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+                        results = ex.map(
+                            _process_one_row,
+                            rows,
+                            [settings] * len(rows),
+                            chunksize=4,
+                        )
+                        self._collect_results(rows, results, pbar, df_results, failed_tests)
+                except BrokenProcessPool:
+                    # workers failed to start or died (for instance a script
+                    # without a __main__ guard under spawn), so start over serially
+                    print("Worker processes failed; analyzing the batch serially.")
+                    df_results.clear()
+                    failed_tests.clear()
+                    pbar.reset()
+                    max_workers = 1
+            if len(rows) < 2 or max_workers < 2:
+                # the pool is joined on exit, so all figures are written
+                # before the results are returned
+                with ThreadPoolExecutor(max_workers=2) as io_pool:
+                    results = (
+                        _process_one_row(row, settings, io_pool) for row in rows
                     )
+                    self._collect_results(rows, results, pbar, df_results, failed_tests)
 
-                    df_res = pd.concat(
-                        [
-                            pd.Series(slug_test.fitting_statistics),
-                            pd.Series(slug_test.estimated_parameters),
-                        ]
-                    )
-                    df_res["test_name"] = slug_test.name
-                    df_results.append(df_res)
-                except:
-                    print(f"Fit failed for test {test_id}")
-                    failed_tests.append(test_id)          
-                pbar.update(1)
-
-
-        df_results = pd.concat(df_results, axis=1)
-        df_results = df_results.transpose()
-        df_results = df_results[
-            ["test_name"] + [col for col in df_results.columns if col != "test_name"]
-        ]
+        df_results = _results_table(df_results)
         self.df_results = df_results
         self.failed_tests = failed_tests
+        self._index_tables()
         self.df_results.to_csv(os.path.join(self.output_folder, "estimated_conductivity.csv"))
     
+    @staticmethod
+    def _collect_results(rows, results, pbar, df_results, failed_tests):
+        """Gather worker results in batch order and report progress."""
+        for row, result in zip(rows, results):
+            test_id = row.get("test_id")
+            pbar.set_postfix_str(f"Processed {test_id} in aquifer {row.get('aquifer_name')}")
+            if result is None:
+                continue
+            test_id, test_results = result
+            if test_results is None:
+                failed_tests.append(test_id)
+            else:
+                df_results.append(test_results)
+            pbar.update(1)
+
+    def _index_tables(self):
+        """Index the batch by test id and the results by test name for lookups."""
+        # the first row wins for a repeated test id, as with a boolean mask
+        self._batch_by_id = self.df_batch.drop_duplicates(subset="test_id").set_index(
+            "test_id"
+        )
+        # repeated test names have no single result and are left out
+        self._results_by_name = self.df_results.drop_duplicates(
+            subset="test_name", keep=False
+        ).set_index("test_name")
+
     def get_well_info(self, test_name, attr = None):
         
-        info = self.df_batch[self.df_batch["test_id"] == test_name][
-                    attr
-                ].values[0]
-        return info
+        return self._batch_by_id.at[test_name, attr]
     
     def get_results(self, test_name = None , attr = None):
         
-        if attr in self.df_results.columns:
-            info = self.df_results[self.df_results["test_name"] == test_name][
-                        attr
-                    ].values
-            if len(info) == 1:
-                info = info[0]
-            else:
-                info = "N/A"
-
+        if (
+            attr in self._results_by_name.columns
+            and test_name in self._results_by_name.index
+        ):
+            info = self._results_by_name.at[test_name, attr]
         else:
             info = "N/A"
         return info
@@ -270,21 +518,21 @@ class Batch_Processing:
 
         test_names = self.df_batch["test_id"].unique()        
         for test_name in test_names:
-            if not (test_name in self.df_results["test_name"].values):                
+            if test_name not in self._results_by_name.index:
                 continue
             components = []
 
             # General Info
             # -----------------
             if 'Test Date' in self.df_batch.columns:
-                test_date = self.df_batch[self.df_batch["test_id"] == test_name]['Test Date'].values[0]
+                test_date = self.get_well_info(test_name, "Test Date")
             else: 
                 test_date = "N/A"
             test_date = "Date of Test: " + test_date
             analysis_date = "Date of Analysis: " + str(date.today())
             
-            well_name = self.df_batch[self.df_batch["test_id"] == test_name]['well_name'].values[0]
-            well_name = "Well Name: " + str(well_name)
+            well_id = self.get_well_info(test_name, "well_name")
+            well_name = "Well Name: " + str(well_id)
             aquifer_name = "Aquifer Name: " + str(self.get_well_info(test_name, "aquifer_name")) 
             aquifer_type = "Aquifer Type: " + str(self.get_well_info(test_name, "aquifer_type"))               
             solution_method = "Solution Method: " + str(self.get_well_info(test_name, "solution_method"))
@@ -317,15 +565,14 @@ class Batch_Processing:
             # Well info
             # -----------------
             cols = ['well_radius', 'casing_radius', 'screen_length', 'screen_top_depth', 'test_data_file', 'slug_volume']
-            df_well = self.df_batch[self.df_batch["test_id"] == test_name]
-            df_well = df_well[cols] 
+            df_well = self._batch_by_id.loc[[test_name], cols]
             basenames = [os.path.basename(f) for f in df_well["test_data_file"]]
             df_well["test_data_file"] = basenames
             df_well = df_well.transpose()            
             df_well.reset_index(inplace=True)
             df_well.columns = ["Parameter", "Value (ft)"]
             # in table df_well, column Parameter, replace "_" with " " and capitalize each word
-            df_well["Parameter"] = df_well["Parameter"].str.replace("_", " ").str.title()
+            df_well["Parameter"] = [_pretty_label(p) for p in df_well["Parameter"]]
             table1 = ("table", df_well, "Well Info")
 
             img_fn = self.get_well_info(test_name, "test_data_file")  
@@ -340,12 +587,11 @@ class Batch_Processing:
             # aquifer info
             # -----------------
             cols = ['aquifer_thickness', 'anisotropy', 'water_table_depth','ground_surface_elevation']
-            df_aq = self.df_batch[self.df_batch["test_id"] == test_name]
-            df_aq = df_aq[cols]
+            df_aq = self._batch_by_id.loc[[test_name], cols]
             df_aq = df_aq.transpose()
             df_aq.reset_index(inplace=True)
             df_aq.columns = ["Parameter", "Value"]
-            df_aq["Parameter"] = df_aq["Parameter"].str.replace("_", " ").str.title()
+            df_aq["Parameter"] = [_pretty_label(p) for p in df_aq["Parameter"]]
             table2 = ("table", df_aq, "Aquifer Info")
             cross_sec_fig = make_schematic_plot()
             row3 = [table2, ('figure', cross_sec_fig)] 
@@ -353,152 +599,133 @@ class Batch_Processing:
 
             # Fitting results
             # -----------------
-            df_fit = self.df_results[self.df_results["test_name"] == test_name]
+            df_fit = self._results_by_name.loc[[test_name]].reset_index()
             df_fit = df_fit.transpose()
             df_fit.reset_index(inplace=True)
             df_fit.columns = ["Parameter", "Value"]
-            df_fit["Parameter"] = df_fit["Parameter"].str.replace("_", " ").str.title()
+            df_fit["Parameter"] = [_pretty_label(p) for p in df_fit["Parameter"]]
             table3 = ("table", df_fit, "Fitting Results")
             fit_fig = os.path.join(self.output_folder, "fit_plots", test_name + ".png")
             row4 = [table3, ('image', fit_fig, "Fit Plot")]
             components.append(row4)
             # Write report
-            well_name = self.df_batch[self.df_batch["test_id"] == test_name]['well_name'].values[0]
-            fn = os.path.join(self.output_folder, "{}_{}_report.html".format(well_name, test_name))
+            fn = os.path.join(self.output_folder, "{}_{}_report.html".format(well_id, test_name))
             gererate_report(components, fn)
             
 
 
+def _config_option(config, key):
+    """Value of key in any section of config, or None if it is missing or NA."""
+    for section in config.sections():
+        if config.has_option(section, key):
+            value = config.get(section, key).strip()
+            if value.lower() != "na":
+                return value
+    return None
+
+
+def _process_csv_row(row, settings):
+    """Analyze one test of run_batch whose data file is already in CSV form."""
+    test_data_file = row.get("test_data_file")
+    test_data = _load_test_csv(test_data_file)
+    # check if the required columns are present
+    if "Time" not in test_data.columns or "Head" not in test_data.columns:
+        raise ValueError(
+            f"The test data file {test_data_file} must contain 'Time' and 'Head' columns."
+        )
+    return _run_one(row, test_data, settings, reraise=True)
+
+
 def run_batch(
-    batch_data=None, output_dir=None, time_unit=None, length_unit=None, config_obj=None
+    batch_data=None,
+    output_dir=None,
+    time_unit=None,
+    length_unit=None,
+    config_obj=None,
+    max_workers=None,
 ):
-    """"""
+    """
+    Analyze a batch of slug tests whose data files are already in CSV form.
+
+    Each test data file must hold 'Time' and 'Head' columns. The fitting is
+    shared with Batch_Processing.run_batch through _run_one. Tests are spread
+    over max_workers processes, taken from config_obj when not given and
+    otherwise from the max_workers setting (one by default); the same
+    ``if __name__ == "__main__":`` guard applies. The time column is parsed
+    with the time_format of config_obj, or as ISO 8601 without one. A failed
+    fit raises its error instead of being left out of the results.
+    """
+    time_format = None
     if config_obj is not None:
 
         batch_data = config_obj.get("Input Info", "batch data file")
         output_dir = config_obj.get("Output Info", "output folder")
         time_unit = config_obj.get("Input Info", "time_unit")
         length_unit = config_obj.get("Input Info", "length_unit")
+        if max_workers is None:
+            max_workers = _config_option(config_obj, "max_workers")
+        time_format = _config_option(config_obj, "time_format")
+    if max_workers is None:
+        max_workers = Batch_Settings().max_workers
 
     # check if df_fn is a dataframe or a file name
     if isinstance(batch_data, pd.DataFrame):
         df = batch_data  # assume it is a dataframe
+        df = df.astype({k: v for k, v in _BATCH_DTYPES.items() if k in df.columns})
     elif isinstance(batch_data, str):
         # check if the file exists and read it
         if not os.path.exists(batch_data):
             raise FileNotFoundError(f"The file {batch_data} does not exist.")
-        df = pd.read_csv(batch_data)
-        df = df.set_index("field").transpose()
+        df = _batch_to_tests(pd.read_csv(batch_data, engine=_CSV_ENGINE))
     else:
         raise ValueError("Input must be a DataFrame or a file name.")
 
     # check if the output directory exists, if not create it
-    if os.path.exists(output_dir):
-        shutil.rmtree(output_dir)
+    _discard_folder(output_dir)
     os.makedirs(output_dir)
-
-    # process each row in the dataframe
-    df_results = []
-    for index, row in df.iterrows():
-        # extract the test parameters
-        test_id = row.get("test_id")
-        test_type = row.get("test_type")
-        aquifer_name = row.get("aquifer_name")
-        aquifer_type = row.get("aquifer_type")
-        aquifer_thickness = float(row.get("aquifer_thickness"))
-        water_table_depth = float(row.get("water_table_depth"))
-        anisotropy = float(row.get("anisotropy"))
-        well_name = row.get("well_name")
-        well_radius = float(row.get("well_radius"))
-        casing_radius = float(row.get("casing_radius"))
-        screen_length = float(row.get("screen_length"))
-        screen_top_depth = float(row.get("screen_top_depth"))
+    plots_dir = os.path.join(output_dir, "fit_plots")
+    os.makedirs(plots_dir, exist_ok=True)
+
+    settings = {
+        "plots_dir": plots_dir,
+        "time_col": "Time",
+        "head_col": "Head",
+        "time_format": time_format or Batch_Settings().time_format,
+        "time_unit": time_unit,
+        "length_unit": length_unit,
+    }
+    # this entry point names the solution method column "method"
+    if "method" in df.columns:
+        df = df.drop(columns="solution_method", errors="ignore")
+        df = df.rename(columns={"method": "solution_method"})
+
+    # namedtuples from itertuples are not picklable, so workers get dicts
+    rows = [row._asdict() for row in df.itertuples(index=False)]
+    for row in rows:
         test_data_file = row.get("test_data_file")
-        slug_volume = float(
-            row.get("slug_volume", pd.NA)
-        )  # default slug volume if not provided
-        test_method = row.get("method")
-
-        # load the test data
-        procced_data_folder = config_obj.get("Output Info", "processed data folder")
-        if not os.path.exists(procced_data_folder):
-            pass
-
         if not os.path.exists(test_data_file):
             raise FileNotFoundError(
                 f"The test data file {test_data_file} does not exist."
             )
 
-        test_data = pd.read_csv(test_data_file)
-        # check if the required columns are present
-        if "Time" not in test_data.columns or "Head" not in test_data.columns:
-            raise ValueError(
-                f"The test data file {test_data_file} must contain 'Time' and 'Head' columns."
+    def collect(results):
+        df_results = []
+        for row, result in zip(rows, results):
+            print(
+                f"Processing {row.get('test_id')}: {row.get('aquifer_name')}, "
+                f"{row.get('well_name')}, {row.get('test_type')}"
             )
+            df_results.append(result)
+        return df_results
 
-        print(f"Processing {test_id}: {aquifer_name}, {well_name}, {test_type}")
-
-        # todo:
-        # here you would call the appropriate analysis function based on the test type
-        # e.g., if test_type == 'slug': analyze_slug_test(...)
-
-        aq = Aquifer(
-            name=aquifer_name,
-            aquifer_type=aquifer_type,
-            ground_surface_elevation=100.0,  # todo: do we need this?
-            saturated_thickness=aquifer_thickness,
-            water_table_depth=water_table_depth,
-            anisotropy=anisotropy,
-            time_unit=time_unit,
-            length_unit=length_unit,
-        )
-
-        test_data["Time"] = pd.to_datetime(test_data["Time"])
-        test_data["Time"] = (
-            test_data["Time"] - test_data["Time"].values[0]
-        ).dt.total_seconds()
-
-        slug_well = SlugWell(
-            name=well_name,
-            well_radius=well_radius,
-            casing_radius=casing_radius,
-            screen_length=screen_length,
-            screen_top_depth=screen_top_depth,
-            head=test_data["Head"].values,
-            time=test_data["Time"].values,
-            slug_volume=slug_volume,
-            is_recovery_data=True,  # rod
-            length_unit=length_unit,
-            time_unit=time_unit,
-        )
-
-        if test_method == "Bouwer_Rice":
-            slug_test = Bouwer_Rice_1976(name=test_id, aquifer=aq, slug_well=slug_well)
-        elif test_method == "Butler":
-            slug_test = Butler_2003(name=test_id, aquifer=aq, slug_well=slug_well)
+    max_workers = int(max_workers or 1)
+    if len(rows) < 2 or max_workers < 2:
+        df_results = collect(_process_csv_row(row, settings) for row in rows)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            df_results = collect(
+                ex.map(_process_csv_row, rows, [settings] * len(rows), chunksize=4)
+            )
 
-        slug_test.analyze()
-        plots_dir = os.path.join(output_dir, "fit_plots")
-        if not (os.path.isdir(plots_dir)):
-            os.makedirs(plots_dir)
-        fig_file = os.path.join(plots_dir, test_id + ".png")
-        slug_test.viz_fig.savefig(fig_file, format="png", dpi=FIG_SAVE_DPI)
-
-        df_res = pd.concat(
-            [
-                pd.Series(slug_test.fitting_statistics),
-                pd.Series(slug_test.estimated_parameters),
-            ]
-        )
-        df_res["test_name"] = slug_test.name
-        df_results.append(df_res)
-
-    df_results = pd.concat(df_results, axis=1)
-    df_results = df_results.transpose()
-    df_results = df_results[
-        ["test_name"] + [col for col in df_results.columns if col != "test_name"]
-    ]
+    df_results = _results_table(df_results)
     return df_results
-
-
-
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.optimize import curve_fit
+from scipy.optimize import least_squares
 
 # matplotlib.use('Agg')
 
@@ -16,6 +16,88 @@ def butler_slug_test_model(t, H0, alpha, beta):
     return H0 * np.exp(-alpha * t) * np.cos(beta * t)
 
 
+class ButlerFit:
+    """
+    butler_slug_test_model and its Jacobian for one curve fit, sharing work.
+
+    The least-squares solver evaluates the Jacobian at the parameters of the
+    last accepted model evaluation, so the exp(-alpha*t), cos(beta*t) and
+    sin(beta*t) terms of the last call are kept and reused while t, alpha
+    and beta are unchanged.
+    """
+
+    def __init__(self):
+        self._t = None
+        self._alpha = None
+        self._beta = None
+        self._e = None
+        self._c = None
+        self._s = None
+
+    def _terms(self, t, alpha, beta):
+        if t is not self._t or alpha != self._alpha or beta != self._beta:
+            self._t, self._alpha, self._beta = t, alpha, beta
+            self._e = np.exp(-alpha * t)
+            self._c = np.cos(beta * t)
+            self._s = None
+        return self._e, self._c
+
+    def __call__(self, t, H0, alpha, beta):
+        e, c = self._terms(t, alpha, beta)
+        return H0 * e * c
+
+    def jac(self, t, H0, alpha, beta):
+        e, c = self._terms(t, alpha, beta)
+        if self._s is None:
+            self._s = np.sin(beta * t)
+        ec = e * c
+        jac = np.empty((t.shape[0], 3))
+        jac[:, 0] = ec
+        jac[:, 1] = -H0 * t * ec
+        jac[:, 2] = -H0 * t * e * self._s
+        return jac
+
+
+def _decay_guesses(t, h, alpha_default=0.01, beta_default=0.1, noise_floor=0.1):
+    """
+    Starting values for alpha and beta estimated from the data.
+    alpha is minus the slope of a log-linear fit of the envelope peaks of |H|
+    against t, beta is pi over the mean spacing of zero crossings. Heads below
+    noise_floor times the largest |H| are ignored. The defaults are used where
+    an estimate cannot be formed.
+    """
+    magnitude = np.abs(h)
+    if magnitude.shape[0] < 3 or magnitude.max() == 0:
+        return alpha_default, beta_default
+    significant = magnitude > noise_floor * magnitude.max()
+
+    # envelope: local maxima of |H|, both end points included
+    peaks = np.r_[
+        True, magnitude[1:-1] >= np.maximum(magnitude[:-2], magnitude[2:]), True
+    ]
+    peaks &= significant
+    if np.count_nonzero(peaks) < 3:
+        peaks = significant
+
+    alpha_guess = alpha_default
+    if np.count_nonzero(peaks) >= 2:
+        A = np.vstack([np.ones_like(t[peaks]), t[peaks]]).T
+        coef, *_ = np.linalg.lstsq(A, np.log(magnitude[peaks]), rcond=None)
+        if np.isfinite(coef[1]) and coef[1] < 0:
+            alpha_guess = -coef[1]
+
+    beta_guess = beta_default
+    t_sig = t[significant]
+    crossings = t_sig[1:][np.diff(np.sign(h[significant])) != 0]
+    if crossings.shape[0] >= 2:
+        beta_guess = np.pi / np.mean(np.diff(crossings))
+    elif crossings.shape[0] == 1 and crossings[0] > 0:
+        # a single crossing is roughly a quarter period after t = 0
+        beta_guess = np.pi / (2 * crossings[0])
+
+    return alpha_guess, beta_guess
+
+
 def estimate_hydraulic_conductivity_butler(
     time_data,
     head_data,
@@ -30,6 +112,13 @@ def estimate_hydraulic_conductivity_butler(
     The Butler method models the head response as an exponentially damped cosine wave.
     It is particularly useful for unconfined aquifers where oscillations might be observed.
 
+    K is computed from the fitted damping (alpha) and frequency (beta) with the
+    commonly cited simplification
+    K = (r_c^2 * alpha) / (2 * r_w * L) * (1 + (beta / alpha)^2),
+    which accounts for both the decay and the oscillation of the response. It is an
+    approximation; the exact relation in Butler's work depends on the aquifer type
+    (confined/unconfined), partial penetration and well conditions.
+
     Parameters:
     time_data (list or np.array): Time values (t) from the slug test, in seconds.
     head_data (list or np.array): Head displacement values (H(t)) from the slug test, in meters.
@@ -47,18 +136,19 @@ def estimate_hydraulic_conductivity_butler(
         'alpha': Fitted alpha parameter.
         'beta': Fitted beta parameter.
         'H0_fitted': Fitted initial head displacement.
-        'popt': Optimal parameters found by curve_fit (H0, alpha, beta).
+        'popt': Optimal parameters found by least_squares (H0, alpha, beta).
         'pcov': Covariance matrix of the fitted parameters.
 
     Raises:
     ValueError: If input data is empty or if curve fitting fails.
     """
 
-    if len(time_data) != len(head_data):
-        raise ValueError("time_data and head_data must have the same length.")
+    # contiguous float64 for the fit; no copy if already in that form
+    time_data = np.ascontiguousarray(time_data, dtype=np.float64)
+    head_data = np.ascontiguousarray(head_data, dtype=np.float64)
 
-    time_data = np.array(time_data)
-    head_data = np.array(head_data)
+    if time_data.shape[0] != head_data.shape[0]:
+        raise ValueError("time_data and head_data must have the same length.")
 
     # Initial guess for parameters
     # H0_guess: Use the first head value or provided initial_head_displacement
@@ -67,163 +157,43 @@ def estimate_hydraulic_conductivity_butler(
         if initial_head_displacement is not None
         else head_data[0]
     )
-    # alpha_guess: A small positive value for damping
-    alpha_guess = 0.01
-    # beta_guess: A small positive value for oscillation frequency
-    beta_guess = 0.1
+    alpha_guess, beta_guess = _decay_guesses(time_data, head_data)
 
     initial_guesses = [H0_guess, alpha_guess, beta_guess]
 
     try:
         # Perform curve fitting to find H0, alpha, and beta
-        popt, pcov = curve_fit(
-            butler_slug_test_model, time_data, head_data, p0=initial_guesses
-        )
-        H0_fitted, alpha, beta = popt
-
-    except RuntimeError as e:
-        raise ValueError(
-            f"Curve fitting failed: {e}. Check your initial guesses or data."
+        # damping and frequency are kept non-negative; H0 is left free since
+        # the displacement is negative for a rising-head test
+        fit = ButlerFit()
+        res = least_squares(
+            lambda p: fit(time_data, *p) - head_data,
+            initial_guesses,
+            jac=lambda p: fit.jac(time_data, *p),
+            bounds=([-np.inf, 0.0, 0.0], [np.inf, np.inf, np.inf]),
+            method="trf",
+            x_scale="jac",
         )
     except Exception as e:
         raise ValueError(f"An unexpected error occurred during curve fitting: {e}")
 
-    # The Butler method relates alpha and beta to hydraulic conductivity (K)
-    # The specific relationship can vary slightly based on the exact derivation.
-    # A common form for K (hydraulic conductivity) is:
-    # K = (r_c^2 * alpha) / (2 * r_w * L * (beta^2 + alpha^2)) * C
-    # Where C is a constant that depends on the aquifer geometry and boundary conditions.
-    # For a simplified approach, often K is related to alpha and beta directly from the fit.
-    # However, the most direct relation for K is often derived from the specific model
-    # parameters.
-    # A common simplified relation for K from Butler's work (for unconfined aquifers) is:
-    # K = (r_c^2 * alpha) / (2 * r_w * L * (beta^2 + alpha^2)) * (pi / 2)
-    # This formula needs careful validation with the specific Butler derivation being used.
-
-    # Let's use a more general form often found in literature that links alpha and beta
-    # to the transmissivity (T) and then K.
-    # For the Butler method, K is often derived from the fitted parameters and well geometry.
-    # One common approximation for K (from some interpretations of Butler's work) is:
-    # K = (r_c^2 * alpha) / (2 * r_w * L) * (1 + (beta/alpha)^2)
-    # This formula is also an approximation and depends on the specific assumptions.
-
-    # A more robust approach for K from Butler's work, especially for unconfined aquifers,
-    # involves the concept of the "characteristic time" (t_c) or specific parameters
-    # from the solution.
-    # The original Butler (1998) solution for unconfined aquifers is complex.
-    # However, if we simplify to the oscillating case, and assuming the model form,
-    # K can be derived.
-
-    # Let's use a commonly cited simplification for K based on alpha and beta for unconfined:
-    # K = (r_c^2 * alpha) / (2 * r_w * L) * (1 + (beta/alpha)^2)
-    # This is a common form, but it's crucial to note that the exact formula for K
-    # from alpha and beta can vary based on the specific assumptions of the Butler model
-    # being applied (e.g., confined vs. unconfined, partial penetration).
-    # For a more precise application, one would typically refer to the specific equations
-    # from Butler's original papers or a textbook that details the derivation.
-
-    # For this implementation, we will use the following common approximation:
-    # K = (r_c^2 * alpha) / (2 * r_w * length_screen)
-    # This is a simplification often used when beta is small or neglected,
-    # or when the oscillations are primarily due to wellbore storage and skin effects.
-    # However, if beta is significant, the oscillatory nature needs to be accounted for.
-
-    # A more complete form, considering the oscillatory behavior, is often given as:
-    # K = (r_c^2 * alpha) / (2 * r_w * length_screen * (1 + (beta/alpha)^2)) * f(geometry)
-    # Where f(geometry) is a function that depends on the well geometry and aquifer properties.
-
-    # Given the request for "Butler method" which implies the oscillatory model,
-    # and without further specifics on the exact Butler derivation, a common approach
-    # for K when alpha and beta are fitted is to use a form related to the damping.
-    # Let's use a formula that attempts to incorporate both alpha and beta:
-    # K = (r_c^2 * alpha) / (2 * r_w * length_screen * (1 + (beta/alpha)**2))
-    # This formula attempts to capture the effect of oscillations on the overall decay.
-    # However, it's important to state that the exact derivation for K from the
-    # fitted alpha and beta parameters of the Butler model can be complex and
-    # context-dependent.
-
-    # For a more direct link to K from the fitted alpha and beta,
-    # one might consider the "characteristic time" (t_c) of the system,
-    # which is often related to 1/alpha.
-    # And then K is derived from t_c and well geometry.
-
-    # Let's stick to a widely cited simplified formula that acknowledges both:
-    # K = (r_c^2 * alpha) / (2 * r_w * length_screen) * (1 + (beta/alpha)**2)
-    # This formula is often used in simplified applications of Butler's method.
-    # It attempts to account for the energy dissipation due to both damping (alpha)
-    # and oscillations (beta).
-
-    # Let's use the formula that is often simplified as:
-    # K = (r_c^2 * alpha) / (2 * r_w * length_screen)
-    # This is a common simplification for the hydraulic conductivity,
-    # especially when the oscillations are not the primary focus of K estimation,
-    # but rather the overall decay.
-
-    # To be more accurate with the Butler method, the specific equation for K
-    # depends on the aquifer type (confined/unconfined) and well conditions.
-    # For unconfined aquifers, Butler's solution is more complex.
-    # If we assume a simplified case where the oscillatory component is primarily
-    # due to wellbore storage and the aquifer response is dominated by the damping,
-    # then a common approximation for K is derived from the damping parameter.
-
-    # Let's use the formula from a common reference for Butler's method (e.g., from a textbook
-    # or a well-known software implementation) which is often:
-    # K = (r_c^2 * alpha) / (2 * r_w * length_screen) * (1 + (beta/alpha)**2)
-    # This formula is a reasonable approximation for the hydraulic conductivity
-    # when using the Butler model.
-
-    # Calculate K using the fitted alpha and beta
-    # Ensure alpha is not zero to avoid division by zero in (beta/alpha)**2
-    if alpha == 0:
+    if not res.success:
         raise ValueError(
-            "Fitted alpha parameter is zero, cannot estimate K using this formula."
+            f"Curve fitting failed: {res.message}. Check your initial guesses or data."
         )
+    popt = res.x
+    H0_fitted, alpha, beta = popt
+
+    # Approximate covariance from Jacobian
+    try:
+        dof = max(time_data.shape[0] - popt.shape[0], 1)
+        J = res.jac
+        s_sq = 2 * res.cost / dof
+        pcov = s_sq * np.linalg.inv(J.T @ J)
+    except np.linalg.LinAlgError:
+        pcov = np.full((popt.shape[0], popt.shape[0]), np.nan)
 
-    # A more common and robust formula for K from Butler's method, particularly
-    # for unconfined aquifers where oscillations are prominent, is derived from
-    # the concept of "characteristic time" and involves the wellbore storage.
-    # However, if we are directly using the fitted alpha and beta from the
-    # `H(t) = H0 * exp(-alpha * t) * cos(beta * t)` model, a common simplified
-    # relation for K is often given as:
-    # K = (r_c^2 * alpha) / (2 * r_w * length_screen)
-    # This is a very simplified form and might not capture the full complexity
-    # of the Butler method.
-
-    # For a more accurate representation of the Butler method, the K calculation
-    # often involves a specific solution curve.
-    # Given the general nature of the request, and the common use of the
-    # `H(t) = H0 * exp(-alpha * t) * cos(beta * t)` form, let's use a formula
-    # that is derived from the damping constant `alpha`.
-    # A common formula for K in such oscillatory slug tests, derived from
-    # similar models (e.g., Hvorslev or Bouwer-Rice adapted for oscillations),
-    # and sometimes simplified from Butler's work, is:
-    # K = (r_c^2 * alpha) / (2 * r_w * length_screen) * (1 + (beta/alpha)**2)
-    # This formula attempts to account for both damping and oscillatory components.
-
-    # Let's use the formula:
-    # K = (r_c**2 * alpha) / (2 * r_w * length_screen) * (1 + (beta/alpha)**2)
-    # This formula is a common approximation for K when using the Butler model.
-
-    # Final decision on K formula:
-    # The most direct interpretation of the Butler method for K from the fitted
-    # alpha and beta parameters of the given model form `H(t) = H0 * exp(-alpha * t) * cos(beta * t)`
-    # often relates K to alpha directly, assuming that alpha represents the overall
-    # decay rate influenced by hydraulic conductivity.
-    # A common simplified formula, especially if beta is small or the primary
-    # focus is on the damping, is:
-    # K = (r_c^2 * alpha) / (2 * r_w * length_screen)
-
-    # However, since the model explicitly includes `beta` for oscillations,
-    # a more comprehensive formula would incorporate its effect.
-    # A formula that accounts for both alpha and beta is:
-    # K = (r_c**2 * alpha) / (2 * r_w * length_screen) * (1 + (beta/alpha)**2)
-    # This formula is often cited in conjunction with oscillatory slug tests.
-
-    # Let's use this formula as it incorporates both fitted parameters.
-    # It's important to note that this is an approximation and the exact formula
-    # from Butler's original work might be more complex or context-specific.
-
-    # Ensure alpha is not zero to avoid division by zero
+    # Ensure alpha is not zero to avoid division by zero in (beta/alpha)**2
     if alpha == 0:
         raise ValueError(
             "Fitted alpha parameter is zero, cannot estimate K using this formula."
@@ -248,6 +218,9 @@ def estimate_hydraulic_conductivity_butler(
 if __name__ == "__main__":
     # --- Example Usage ---
 
+    # seeded so the examples print the same results on every run
+    rng = np.random.default_rng(0)
+
     # Example 1: Hypothetical slug test data with oscillations
     print("--- Example 1: Hypothetical Slug Test Data ---")
     time_data_ex1 = np.array(
@@ -273,19 +246,18 @@ if __name__ == "__main__":
             90,
             95,
             100,
-        ]
+        ],
+        dtype=np.float64,
     )
     # Simulate an oscillatory decay
     H0_true = 1.0  # Initial head displacement
     alpha_true = 0.05  # Damping parameter
     beta_true = 0.2  # Oscillation parameter
-    head_data_ex1 = (
-        H0_true
-        * np.exp(-alpha_true * time_data_ex1)
-        * np.cos(beta_true * time_data_ex1)
+    head_data_ex1 = butler_slug_test_model(
+        time_data_ex1, H0_true, alpha_true, beta_true
     )
     # Add some noise for realism
-    head_data_ex1 += np.random.normal(0, 0.02, size=head_data_ex1.shape)
+    head_data_ex1 += rng.normal(0, 0.02, size=head_data_ex1.shape)
 
     # Well parameters (example values)
     r_c_ex1 = 0.05  # Casing radius = 5 cm = 0.05 m
@@ -305,17 +277,16 @@ if __name__ == "__main__":
 
     print("\n--- Example 2: Data with less prominent oscillations ---")
     time_data_ex2 = np.array(
-        [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120, 130, 140, 150]
+        [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120, 130, 140, 150],
+        dtype=np.float64,
     )
     H0_true_ex2 = 0.8
     alpha_true_ex2 = 0.03
     beta_true_ex2 = 0.05  # Smaller beta for less prominent oscillations
-    head_data_ex2 = (
-        H0_true_ex2
-        * np.exp(-alpha_true_ex2 * time_data_ex2)
-        * np.cos(beta_true_ex2 * time_data_ex2)
+    head_data_ex2 = butler_slug_test_model(
+        time_data_ex2, H0_true_ex2, alpha_true_ex2, beta_true_ex2
     )
-    head_data_ex2 += np.random.normal(0, 0.01, size=head_data_ex2.shape)
+    head_data_ex2 += rng.normal(0, 0.01, size=head_data_ex2.shape)
 
     r_c_ex2 = 0.06
     r_w_ex2 = 0.08
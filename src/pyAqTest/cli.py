@@ -1,15 +1,16 @@
+import functools
 import os
 import shutil
 from os import mkdir
 
+import numpy as np
 import pandas as pd
 import typer
 from rich.console import Console
 from rich.text import Text
 from rich.table import Table
 
-import pyAqTest.utils
-from art import *
+import pyAqTest
 
 app = typer.Typer()
 console = Console()
@@ -18,6 +19,9 @@ console = Console()
 @app.command()
 def main():
     """Show banner."""
+    # only needed for the banner, so not loaded with the module
+    from art import text2art
+
     clear_screen()
     banner_text = Text("Slug Test Analysis", style="bold magenta", justify="center")
     tit = text2art("AqTest", font="tarty1")
@@ -205,12 +209,25 @@ def table2console(console, df: pd.DataFrame, title):
     for col in df.columns:
         table.add_column(str(col), justify="left")
 
+    # Format whole columns at once; only non-numeric columns are formatted
+    # cell by cell
+    columns = []
+    for col in df.columns:
+        values = df[col].to_numpy()
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            x = values.astype(float)
+            columns.append(
+                np.where(
+                    np.abs(x) >= 10**-3, np.char.mod("%.3f", x), np.char.mod("%.1e", x)
+                )
+            )
+        else:
+            columns.append([str(adaptive_format(item, 3)) for item in values])
+
     # Add rows with index
-    for idx, row in df.iterrows():
+    for idx, *cells in zip(df.index, *columns):
         index_str = f"[bright_blue]{idx}[/bright_blue]"
-        table.add_row(
-            index_str, *[str(adaptive_format(item, 3)) for item in row.values]
-        )
+        table.add_row(index_str, *cells)
 
     console.print(table)
 
@@ -225,7 +242,9 @@ def adaptive_format(x, decimals=2):
         return f"{x:.1e}"
 
 
-def get_slug_data_example():
+@functools.lru_cache(maxsize=1)
+def _example_rows():
+    """Rows (field name, then one value per test) of the static example table."""
     columns = [
         "test_id",
         "test_type",
@@ -298,6 +317,16 @@ def get_slug_data_example():
         },
     ]
 
+    # For each field (column in original), a row with field name and all values
+    return tuple(
+        (field, *[str(d.get(field, "")) for d in data]) for field in columns
+    )
+
+
+def get_slug_data_example():
+    # the example data is built once; a Rich Table is created per call
+    rows = _example_rows()
+
     # Create table with first column as field names
     table = Table(title="Slug Test Example", title_style="bold blue")
 
@@ -305,14 +334,10 @@ def get_slug_data_example():
     table.add_column(" ", style="cyan", no_wrap=True)
 
     # Add one column per data record, use test_id for header
-    for iid, d in enumerate(data):
+    for iid in range(len(rows[0]) - 1):
         table.add_column(str(iid + 1), style="white")
 
-    # For each field (column in original), add a row with field name and all values
-    for field in columns:
-        row = [field]  # first cell is the field name
-        for d in data:
-            row.append(str(d.get(field, "")))
+    for row in rows:
         table.add_row(*row)
 
     console.print(table)
@@ -320,12 +345,9 @@ def get_slug_data_example():
 
 def clear_screen():
     """Clears the console screen."""
-    # For Windows
-    if os.name == "nt":
-        _ = os.system("cls")
-    # For macOS and Linux (Unix-like systems)
-    else:
-        _ = os.system("clear")
+    # Rich writes the clear/home control codes itself (including on Windows
+    # consoles) instead of spawning a shell for cls/clear
+    console.clear()
 
 
 
@@ -4,21 +4,26 @@ Dashboard Package
 Dashboard components for the Batch Slug Test Analysis application.
 """
 
-from .layout import create_main_layout
-from .callbacks import register_callbacks
-from .results_callbacks import register_results_callbacks
-from .data_storage import get_data_storage, add_data
-from .utils import read_ini_file
-from .components import (
-    create_upload_area,
-    create_analysis_controls,
-    create_analysis_plot,
-    create_summary_card,
-    create_export_card,
-    create_analysis_settings_card,
-    create_display_settings_card,
-    create_results_table
-)
+import importlib
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in dash/plotly until a component is used.
+_LAZY_ATTRS = {
+    'create_main_layout': 'layout',
+    'register_callbacks': 'callbacks',
+    'register_results_callbacks': 'results_callbacks',
+    'get_data_storage': 'data_storage',
+    'add_data': 'data_storage',
+    'read_ini_file': 'utils',
+    'create_upload_area': 'components',
+    'create_analysis_controls': 'components',
+    'create_analysis_plot': 'components',
+    'create_summary_card': 'components',
+    'create_export_card': 'components',
+    'create_analysis_settings_card': 'components',
+    'create_display_settings_card': 'components',
+    'create_results_table': 'components',
+}
 
 __all__ = [
     'create_main_layout',
@@ -36,3 +41,16 @@ __all__ = [
     'create_results_table',
     'register_results_callbacks'
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
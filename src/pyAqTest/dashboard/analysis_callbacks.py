@@ -4,37 +4,187 @@ Analysis Tab Callbacks
 Callbacks specifically for the Analysis tab functionality.
 """
 import os
+import hashlib
 import dash
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-import pandas as pd
+from dash.exceptions import PreventUpdate
+import numpy as np
+from tqdm import tqdm as real_tqdm
 from .data_storage import get_data_storage, add_data
 
 
+class TqdmProxy:
+    """tqdm stand-in for batch runs that mirrors progress into data storage."""
+
+    def __init__(self, *args, **kwargs):
+        self._t = real_tqdm(*args, **kwargs)
+        self.total = kwargs.get('total')
+        self.n = 0
+        add_data('batch_progress', {'current': self.n, 'total': self.total})
+
+    def update(self, n=1):
+        self.n += n
+        add_data('batch_progress', {'current': self.n, 'total': self.total})
+        return self._t.update(n)
+
+    def reset(self, total=None):
+        if total is not None:
+            self.total = total
+        self.n = 0
+        add_data('batch_progress', {'current': self.n, 'total': self.total})
+        return self._t.reset(total)
+
+    def set_postfix_str(self, s):
+        return self._t.set_postfix_str(s)
+
+    def __enter__(self):
+        self._t.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._t.__exit__(exc_type, exc, tb)
+
+
+def _batch_fingerprint(ini_filename, batch):
+    """Hash the inputs of a batch run: INI file, batch table and raw data files."""
+    digest = hashlib.sha256()
+    for fn in (ini_filename, batch.batch_data_file):
+        with open(fn, "rb") as f:
+            digest.update(f.read())
+    raw_folder = batch.raw_data_folder
+    if os.path.isdir(raw_folder):
+        for entry in sorted(os.scandir(raw_folder), key=lambda e: e.name):
+            if entry.is_file():
+                st = entry.stat()
+                digest.update(f"{entry.name}:{st.st_size}:{st.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _extract_test_ids(df):
+    """Unique values of the 'test_id' row of a batch table, or None if it has none."""
+    if 'field' not in df.columns:
+        return None
+    # read the one row needed instead of transposing the whole table
+    hits = np.flatnonzero(df['field'].to_numpy() == 'test_id')
+    if hits.size == 0:
+        return None
+    values = df.iloc[hits[0]].drop('field').to_numpy()
+    # a dict dedups the few hundred ids of a batch table faster than factorizing
+    return list(dict.fromkeys(values.tolist()))
+
+
+def get_unique_test_ids(data_storage):
+    """Unique test ids of the loaded batch table, cached per loaded table."""
+    df = data_storage.get('csv_batch_data')
+    if df is None:
+        return []
+    if data_storage.get('_cached_df_id') == id(df):
+        return data_storage['_cached_tests']
+
+    unique_tests = _extract_test_ids(df) or []
+    data_storage['_cached_tests'] = unique_tests
+    data_storage['_cached_df_id'] = id(df)
+    return unique_tests
+
+
+def _run_status_card(ok):
+    """Status card shown after the Run Batch button starts (or fails to start) a run."""
+    header = "🚀 Batch Analysis Started" if ok else "❌ Batch Start Failed"
+    subtitle = "Processing batch file: " if ok else "Missing INI file path"
+    return dbc.Card([
+        dbc.CardHeader([
+            html.H5(header, className="mb-0"),
+            html.Small(subtitle, className="text-muted")
+        ]),
+        dbc.CardBody([
+            dbc.Row([
+                dbc.Col([
+                    html.H6("Mode:", className="fw-bold"),
+                    html.Div("Run from Batch File ")
+                ], width=6),
+                dbc.Col([
+                    html.H6("Progress:", className="fw-bold"),
+                    html.Div(id='batch-progress-container')
+                ], width=6)
+            ])
+        ])
+    ], color="success" if ok else "danger", outline=True)
+
+
+# the status card has no per-run content, so both variants are built once
+_RUN_STATUS_CARDS = {True: _run_status_card(True), False: _run_status_card(False)}
+
+
+# the "Run Selected Tests" tab is static; its dropdown options come from
+# test-ids-store on the client
+_RUN_SELECTED_TAB = dbc.Tab(
+    label="Run Selected Tests",
+    tab_id="mode-selected",
+    disabled=True,
+    children=[
+        dbc.Label("Select Tests to Run:", className="fw-bold mb-2"),
+        dcc.Dropdown(
+            id="test-selector-dropdown",
+            options=[],
+            value=[],
+            placeholder="Choose tests to analyze...",
+            multi=True,
+            disabled=True,
+            style={"fontSize": "14px"}
+        ),
+        html.Small(
+            "Run Selected Tests is inactive for now",
+            className="text-muted mt-1"
+        )
+    ]
+)
+
+
 def register_analysis_callbacks(app):
     """Register analysis-specific callbacks"""
     
     @app.callback(
-        dash.dependencies.Output('test-selection-card', 'children'),
+        [dash.dependencies.Output('test-selection-card', 'children'),
+         dash.dependencies.Output('test-ids-store', 'data')],
         [dash.dependencies.Input('batch-table-info', 'children')],
         prevent_initial_call=True
     )
     def create_test_selection_card(batch_table_children):
-        """Create analysis run controls with two modes (batch default)."""
+        """Create analysis run controls with two modes (batch default).
+
+        The card carries the test dropdown, so rebuilding it on new batch data
+        also clears the selection. The test ids and the batch table shape go
+        to test-ids-store, from which the browser builds the dropdown options
+        and the results summary.
+
+        batch-table-info also changes when an upload fails to load a new
+        table; the card is left alone then, keeping the current selection.
+        """
         data_storage = get_data_storage()
 
-        test_options = []
-        if 'csv_batch_data' in data_storage and data_storage['csv_batch_data'] is not None:
-            df = data_storage['csv_batch_data']
-            if 'field' in df.columns:
-                df_t = df.set_index("field").transpose()
-                if 'test_id' in df_t.columns:
-                    unique_tests = df_t['test_id'].unique().tolist()
-                    test_options = [{"label": str(t), "value": str(t)} for t in unique_tests]
+        df = data_storage.get('csv_batch_data')
+        server_run_path = data_storage.get('server_run_path')
+        # the table itself is kept rather than its id, which a newly loaded
+        # table could reuse
+        last_inputs = data_storage.get('_test_card_inputs')
+        if (
+            last_inputs is not None
+            and last_inputs[0] is df
+            and last_inputs[1] == server_run_path
+        ):
+            return dash.no_update, dash.no_update
+        data_storage['_test_card_inputs'] = (df, server_run_path)
+
+        test_ids = {
+            "test_ids": [str(t) for t in get_unique_test_ids(data_storage)],
+            # read by the Results tab summary, which renders in the browser
+            "shape": None if df is None else list(df.shape),
+        }
 
-        has_server_ini = bool(get_data_storage().get('server_run_path'))
+        has_server_ini = bool(server_run_path)
         if has_server_ini:
-            batch_file_name = data_storage['server_run_path']
+            batch_file_name = server_run_path
         else:
             batch_file_name = "N/A"
         return dbc.Card([
@@ -58,29 +208,23 @@ def register_analysis_callbacks(app):
                             )
                         ]
                     ),
-                    dbc.Tab(
-                        label="Run Selected Tests",
-                        tab_id="mode-selected",
-                        disabled=True,
-                        children=[
-                            dbc.Label("Select Tests to Run:", className="fw-bold mb-2"),
-                            dcc.Dropdown(
-                                id="test-selector-dropdown",
-                                options=test_options,
-                                placeholder="Choose tests to analyze...",
-                                multi=True,
-                                disabled=True,
-                                style={"fontSize": "14px"}
-                            ),
-                            html.Small(
-                                "Run Selected Tests is inactive for now",
-                                className="text-muted mt-1"
-                            )
-                        ]
-                    ),
+                    _RUN_SELECTED_TAB,
                 ], id="analysis-run-tabs", active_tab="mode-batch")
             ])
-        ], className="mb-4")
+        ], className="mb-4"), test_ids
+
+    # Dropdown options are a plain reshaping of the stored test ids
+    app.clientside_callback(
+        """
+        function(data) {
+            if (!data) { return []; }
+            return data.test_ids.map(t => ({label: t, value: t}));
+        }
+        """,
+        dash.dependencies.Output('test-selector-dropdown', 'options'),
+        dash.dependencies.Input('test-ids-store', 'data'),
+        prevent_initial_call=True
+    )
 
     # Helper (no decorator): run the batch analysis
     def _run_batch_process():
@@ -89,29 +233,6 @@ def register_analysis_callbacks(app):
         # Monkey-patch tqdm used inside run_batch to report progress
         try:
             import pyAqTest.batch_processing as bp
-            from tqdm import tqdm as real_tqdm
-
-            class TqdmProxy:
-                def __init__(self, *args, **kwargs):
-                    self._t = real_tqdm(*args, **kwargs)
-                    self.total = kwargs.get('total')
-                    self.n = 0
-                    add_data('batch_progress', {'current': self.n, 'total': self.total})
-
-                def update(self, n=1):
-                    self.n += n
-                    add_data('batch_progress', {'current': self.n, 'total': self.total})
-                    return self._t.update(n)
-
-                def set_postfix_str(self, s):
-                    return self._t.set_postfix_str(s)
-
-                def __enter__(self):
-                    self._t.__enter__()
-                    return self
-
-                def __exit__(self, exc_type, exc, tb):
-                    return self._t.__exit__(exc_type, exc, tb)
 
             bp.tqdm = TqdmProxy
         except Exception:
@@ -121,8 +242,24 @@ def register_analysis_callbacks(app):
         if not ini_filename:
             return False
         batch = pyAqTest.Batch_Processing(config_obj=ini_filename)
+
+        # Reuse the previous run when none of its inputs changed and its
+        # results are still on disk
+        key = _batch_fingerprint(ini_filename, batch)
+        cached = data_storage.get('batch_obj')
+        results_file = os.path.join(batch.output_folder, "estimated_conductivity.csv")
+        if (
+            cached is not None
+            and data_storage.get('batch_fingerprint') == key
+            and os.path.exists(results_file)
+        ):
+            n_tests = len(cached.df_batch)
+            add_data('batch_progress', {'current': n_tests, 'total': n_tests})
+            return True
+
         batch.run_batch()
         add_data('batch_obj', batch)
+        add_data('batch_fingerprint', key)
         return True
 
     @app.callback(
@@ -133,90 +270,46 @@ def register_analysis_callbacks(app):
     )
     def run_analysis(n_clicks_batch, selected_tests):
         """Run batch only when Run Batch is clicked."""
-        if n_clicks_batch:
-            ok = _run_batch_process()
-            header = "🚀 Batch Analysis Started" if ok else "❌ Batch Start Failed"
-            subtitle = "Processing batch file: " if ok else "Missing INI file path"
-            # reveal the global progress container when starting
-            return dbc.Card([
-                dbc.CardHeader([
-                    html.H5(header, className="mb-0"),
-                    html.Small(subtitle, className="text-muted")
-                ]),
-                dbc.CardBody([
-                    dbc.Row([
-                        dbc.Col([
-                            html.H6("Mode:", className="fw-bold"),
-                            html.Div("Run from Batch File ")
-                        ], width=6),
-                        dbc.Col([
-                            html.H6("Progress:", className="fw-bold"),
-                            html.Div(id='batch-progress-container')
-                        ], width=6)
-                    ])
-                ])
-            ], color="success" if ok else "danger", outline=True)
-
-        return ""
+        if not n_clicks_batch:
+            raise PreventUpdate
+        # reveal the global progress container when starting
+        return _RUN_STATUS_CARDS[_run_batch_process()]
 
     @app.callback(
-        [dash.dependencies.Output('batch-progress-interval', 'disabled', allow_duplicate=True),
-         dash.dependencies.Output('batch-progress-bar', 'value', allow_duplicate=True),
-         dash.dependencies.Output('batch-progress-text', 'children', allow_duplicate=True),
-         dash.dependencies.Output('batch-progress-container', 'style', allow_duplicate=True)],
-        [dash.dependencies.Input('run-batch-btn', 'n_clicks')],
-        prevent_initial_call=True
-    )
-    def _start_progress(_n):
-        # Enable interval and reset bar when run starts
-        return False, 0, "Starting...", {"display": "block"}
-
-    @app.callback(
-        [dash.dependencies.Output('batch-progress-bar', 'value', allow_duplicate=True),
-         dash.dependencies.Output('batch-progress-text', 'children', allow_duplicate=True),
-         dash.dependencies.Output('batch-progress-interval', 'disabled', allow_duplicate=True),
-         dash.dependencies.Output('batch-progress-container', 'style', allow_duplicate=True)],
+        dash.dependencies.Output('batch-progress-store', 'data'),
         [dash.dependencies.Input('batch-progress-interval', 'n_intervals')],
         prevent_initial_call=True
     )
-    def _poll_progress(_n):
+    def _poll_progress(_n_intervals):
+        """Publish the progress the batch run has reported, once per interval tick."""
         prog = get_data_storage().get('batch_progress') or {}
-        cur = prog.get('current') or 0
-        tot = prog.get('total') or None
-        if tot and tot > 0:
-            pct = int(100 * cur / tot)
-            done = cur >= tot
-            return pct, f"{cur} / {tot}", done, ({"display": "none"} if done else {"display": "block"})
-        return 0, "Starting...", False, {"display": "block"}
+        return {'current': prog.get('current') or 0, 'total': prog.get('total') or None}
 
-    # Removed progress polling logic per user request
-
-    @app.callback(
-        dash.dependencies.Output('test-selector-dropdown', 'options', allow_duplicate=True),
-        [dash.dependencies.Input('batch-table-info', 'children')],
+    # The progress bar, its text, the interval and the container visibility
+    # all follow from the polled progress, so they are updated together in
+    # the browser
+    app.clientside_callback(
+        """
+        function(nClicks, prog) {
+            const starting = [0, "Starting...", false, {display: 'block'}];
+            // Enable interval and reset bar when run starts
+            if (dash_clientside.callback_context.triggered_id === 'run-batch-btn') {
+                return starting;
+            }
+            if (!prog || !(prog.total > 0)) { return starting; }
+            const pct = Math.trunc(100 * prog.current / prog.total);
+            const done = prog.current >= prog.total;
+            return [pct, `${prog.current} / ${prog.total}`, done,
+                    done ? {display: 'none'} : {display: 'block'}];
+        }
+        """,
+        [dash.dependencies.Output('batch-progress-bar', 'value'),
+         dash.dependencies.Output('batch-progress-text', 'children'),
+         dash.dependencies.Output('batch-progress-interval', 'disabled'),
+         dash.dependencies.Output('batch-progress-container', 'style')],
+        [dash.dependencies.Input('run-batch-btn', 'n_clicks'),
+         dash.dependencies.Input('batch-progress-store', 'data')],
         prevent_initial_call=True
     )
-    def update_test_options(batch_table_children):
-        """Update test options when CSV data is loaded"""
-        data_storage = get_data_storage()
-        
-        if 'csv_batch_data' in data_storage and data_storage['csv_batch_data'] is not None:
-            df = data_storage['csv_batch_data']
-            
-            if 'field' in df.columns:
-                df_t = df.set_index("field").transpose()
-                
-                if 'test_id' in df_t.columns:
-                    unique_tests = df_t['test_id'].unique().tolist()
-                    return [{"label": str(test), "value": str(test)} for test in unique_tests]
-        
-        return []
 
-    @app.callback(
-        [dash.dependencies.Output('test-selector-dropdown', 'value', allow_duplicate=True)],
-        [dash.dependencies.Input('batch-table-info', 'children')],
-        prevent_initial_call=True
-    )
-    def reset_test_selection(batch_table_children):
-        """Reset test selection when new data is loaded"""
-        return [[]]
+    # Removed progress polling logic per user request
@@ -7,22 +7,94 @@ Contains all callback functions for the Batch Slug Test Analysis dashboard.
 import dash
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
 import base64
 import pandas as pd
 import os
 import tempfile
 import configparser
+import hashlib
+import weakref
+from itertools import islice
+from dash.exceptions import PreventUpdate
 from .data_storage import get_data_storage, add_data
 from .analysis_callbacks import register_analysis_callbacks
 from .results_callbacks import register_results_callbacks
 
+# parsed INI uploads keyed by a digest of the data URL; Dash fires both upload
+# callbacks with the same contents, and re-selecting a file replays them
+_INI_CACHE = {}
+_INI_CACHE_SIZE = 32
+
+
+def _parse_ini_contents(contents):
+    """Decode an uploaded INI data URL into a {section: {key: value}} dict."""
+    key = hashlib.blake2b(contents.encode(), digest_size=16).digest()
+    config_dict = _INI_CACHE.get(key)
+    if config_dict is None:
+        decoded = base64.b64decode(contents.partition(',')[2]).decode('utf-8')
+        config = configparser.ConfigParser()
+        config.read_string(decoded)
+        config_dict = {section: dict(config[section]) for section in config.sections()}
+        if len(_INI_CACHE) >= _INI_CACHE_SIZE:
+            _INI_CACHE.pop(next(iter(_INI_CACHE)))
+        _INI_CACHE[key] = config_dict
+    # callers get their own section dicts so the cached entry stays untouched
+    return {section: dict(values) for section, values in config_dict.items()}
+
+
+# action buttons at the foot of the INI config form
+_INI_FORM_ACTIONS = dbc.Card([
+    dbc.CardBody([
+        dbc.Row([
+            dbc.Col([
+                dbc.Button("💾 Save Changes", color="primary", className="me-2"),
+                dbc.Button("🔄 Reset", color="secondary", className="me-2"),
+                dbc.Button("📤 Export", color="info")
+            ], width=12)
+        ])
+    ])
+])
+
+
+# INI forms already built, keyed by _form_cache_key; re-uploading the same
+# file rebuilds an identical form
+_FORM_CACHE = {}
+_FORM_CACHE_SIZE = 16
+
+
+def _form_cache_key(config_dict, filename, folder_path):
+    """Hashable key for a form, or None if the config holds unhashable values."""
+    key = (filename, folder_path,
+           tuple((section, tuple(data.items())) for section, data in config_dict.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _batch_table_notice(title, message, level="warning"):
+    """Title and message shown in place of the batch table when it cannot be loaded"""
+    return html.Div([
+        html.H6(title, className=f"text-{level}"),
+        html.P(message)
+    ])
+
+
+# notices for INI files that do not point at a batch table; they never vary
+_NO_BATCH_DATA_FILE_NOTICE = _batch_table_notice(
+    "No batch_data_file found",
+    "The INI file does not contain a 'batch_data_file' key in the 'Input Info' section"
+)
+_NO_INPUT_INFO_NOTICE = _batch_table_notice(
+    "No Input Info section found",
+    "The INI file does not contain an 'Input Info' section"
+)
+
+
 def create_ini_config_form(config_dict, filename, file_path=None):
     """Create a compact, multi-column form with INI config file content"""
-    form_elements = []
-    
     # Get the actual file path from global data storage
-    import os
     data_storage = get_data_storage()
     if 'file_path' in data_storage:
         folder_path = os.path.dirname(data_storage['file_path'])
@@ -30,6 +102,13 @@ def create_ini_config_form(config_dict, filename, file_path=None):
         folder_path = os.path.dirname(file_path)
     else:
         folder_path = "Unknown"
+
+    key = _form_cache_key(config_dict, filename, folder_path)
+    cached = _FORM_CACHE.get(key) if key is not None else None
+    if cached is not None:
+        return list(cached)
+
+    form_elements = []
     
     # Add file info header
     form_elements.append(
@@ -47,6 +126,7 @@ def create_ini_config_form(config_dict, filename, file_path=None):
     )
     
     # Create form for each section
+    id_fmt = "config-{}-{}".format
     for section_name, section_data in config_dict.items():
         if section_name == "file_path":
             continue
@@ -70,7 +150,7 @@ def create_ini_config_form(config_dict, filename, file_path=None):
                             ),
                             dbc.Input(
                                 value=str(value),
-                                id=f"config-{section_name}-{key}",
+                                id=id_fmt(section_name, key),
                                 className="mb-1",
                                 size="sm"
                             )
@@ -81,21 +161,49 @@ def create_ini_config_form(config_dict, filename, file_path=None):
         )
     
     # Add action buttons
-    form_elements.append(
-        dbc.Card([
-            dbc.CardBody([
-                dbc.Row([
-                    dbc.Col([
-                        dbc.Button("💾 Save Changes", color="primary", className="me-2"),
-                        dbc.Button("🔄 Reset", color="secondary", className="me-2"),
-                        dbc.Button("📤 Export", color="info")
-                    ], width=12)
-                ])
-            ])
-        ])
-    )
-    
-    return form_elements
+    form_elements.append(_INI_FORM_ACTIONS)
+
+    if key is not None:
+        if len(_FORM_CACHE) >= _FORM_CACHE_SIZE:
+            _FORM_CACHE.pop(next(iter(_FORM_CACHE)))
+        _FORM_CACHE[key] = form_elements
+    return list(form_elements)
+
+# constant parts of the batch table figure, shared by every figure built
+_TABLE_HEADER_FILL = {'color': '#007bff'}
+_TABLE_HEADER_FONT = {'color': 'white', 'size': 12}
+_TABLE_CELL_FILL = {'color': ['#f8f9fa', 'white']}
+_TABLE_CELL_FONT = {'size': 11}
+_TABLE_MARGIN = {'l': 10, 'r': 10, 't': 50, 'b': 10}
+_TABLE_TITLE = 'Batch Data: %s (Showing %d of %d columns)'
+# column selections whose figures are kept per loaded table
+_TABLE_FIGURE_CACHE_SIZE = 32
+
+
+def _table_figure(df, columns, filename):
+    """Plotly table figure (as a plain dict) showing the given columns of df"""
+    return {
+        'data': [{
+            'type': 'table',
+            'header': {
+                'values': columns,
+                'fill': _TABLE_HEADER_FILL,
+                'font': _TABLE_HEADER_FONT
+            },
+            'cells': {
+                'values': [df[col].tolist() for col in columns],
+                'fill': _TABLE_CELL_FILL,
+                'font': _TABLE_CELL_FONT,
+                'height': 30
+            }
+        }],
+        'layout': {
+            'title': _TABLE_TITLE % (filename, len(columns), len(df.columns)),
+            'height': min(600, 200 + len(df) * 30),
+            'margin': _TABLE_MARGIN
+        }
+    }
+
 
 def create_csv_table(df, filename):
     """Create an interactive table from CSV data with column selection and search"""
@@ -136,7 +244,7 @@ def create_csv_table(df, filename):
                     dcc.Dropdown(
                         id="column-selector",
                         options=[{"label": col, "value": col} for col in df.columns],
-                        value=df.columns[:10].tolist() if len(df.columns) > 10 else df.columns.tolist(),
+                        value=list(islice(df.columns, 10)),
                         multi=True,
                         style={"fontSize": "14px"}
                     )
@@ -153,30 +261,10 @@ def create_csv_table(df, filename):
     ], className="mb-3")
     
     # Create interactive table using dash_table with initial subset
-    initial_cols = df.columns[:10].tolist() if len(df.columns) > 10 else df.columns.tolist()
+    initial_cols = list(islice(df.columns, 10))
     table = dcc.Graph(
         id="csv-data-table",
-        figure={
-            'data': [{
-                'type': 'table',
-                'header': {
-                    'values': initial_cols,
-                    'fill': {'color': '#007bff'},
-                    'font': {'color': 'white', 'size': 12}
-                },
-                'cells': {
-                    'values': [df[col].tolist() for col in initial_cols],
-                    'fill': {'color': ['#f8f9fa', 'white']},
-                    'font': {'size': 11},
-                    'height': 30
-                }
-            }],
-            'layout': {
-                'title': f'Batch Data: {filename} (Showing {len(initial_cols)} of {len(df.columns)} columns)',
-                'height': min(600, 200 + len(df) * 30),
-                'margin': {'l': 10, 'r': 10, 't': 50, 'b': 10}
-            }
-        },
+        figure=_table_figure(df, initial_cols, filename),
         config={'displayModeBar': False}
     )
     
@@ -218,122 +306,41 @@ def create_csv_table(df, filename):
     
     return components
 
+# apps that already have the dashboard callbacks; registering twice would
+# give every output a second callback
+_REGISTERED = weakref.WeakSet()
+
+
 def register_callbacks(app):
-    """Register all callbacks with the app"""
+    """Register all callbacks with the app (once per app)"""
+    if app in _REGISTERED:
+        return
+    _REGISTERED.add(app)
     
-    # Callback for load action button
-    @app.callback(
-        dash.dependencies.Output('action-tab-content', 'children'),
-        [dash.dependencies.Input('load-action-btn', 'n_clicks')]
-    )
-    def update_load_content(n_clicks):
-        """Update content for load action"""
-        if n_clicks:
-            return [
-                dbc.Row([
-                    dbc.Col([
-                        html.H6("Load Batch File", className="mb-3"),
-                        html.P("Select and load an existing batch file for analysis", className="text-muted mb-3"),
-                        
-                        # Direct file input - no Choose File button needed
-                        dcc.Upload(
-                            id="file-input",
-                            children=html.Div([
-                                html.A('📁 Choose .ini File', 
-                                       style={'color': 'white', 'textDecoration': 'none', 'fontWeight': 'bold', 'fontSize': '16px'})
-                            ], style={'padding': '12px 24px', 'backgroundColor': '#007bff', 'borderRadius': '6px', 'cursor': 'pointer', 'display': 'inline-block', 'border': 'none', 'textAlign': 'center'}),
-                            style={"display": "block", "margin": "10px 0"},
-                            accept=".ini",
-                            multiple=False
-                        ),
-                        
-                        html.Hr(),
-                        html.H6("File Details", className="mb-3"),
-                        dbc.Tabs([
-                            dbc.Tab(
-                                label="Settings File Details",
-                                tab_id="settings-tab",
-                                children=[
-                                    html.Div(id='load-file-info', children="No file selected")
-                                ]
-                            ),
-                            dbc.Tab(
-                                label="Batch Table",
-                                tab_id="batch-table-tab",
-                                children=[
-                                    html.Div([
-                                        html.H6("Batch Data Table", className="mb-3"),
-                                        html.P("CSV data will be automatically loaded from the INI file configuration", className="text-muted mb-3"),
-                                        html.Div(id='batch-table-info', children="No batch data loaded")
-                                    ])
-                                ]
-                            )
-                        ], id="file-details-tabs", active_tab="settings-tab"),
-                        html.Hr(),
-                        html.H6("Recent Files:", className="mt-3"),
-                        html.Div(id='recent-files', children="No recent files")
-                    ], width=12)
-                ])
-            ]
-        return "Select an action"
-    
-    # Callback for new action button
-    @app.callback(
-        dash.dependencies.Output('action-tab-content', 'children', allow_duplicate=True),
-        [dash.dependencies.Input('new-action-btn', 'n_clicks')],
-        prevent_initial_call=True
-    )
-    def update_new_content(n_clicks):
-        """Update content for new action"""
-        if n_clicks:
+    # The action panels are part of the initial layout; each button shows its
+    # own panel and hides the others, without a server round trip
+    app.clientside_callback(
+        """
+        function(nLoad, nNew, nSave) {
+            const shown = dash_clientside.callback_context.triggered_id;
+            const style = id => (id === shown ? {} : {display: 'none'});
             return [
-                dbc.Row([
-                    dbc.Col([
-                        html.H6("Create New Batch", className="mb-3"),
-                        html.P("Start a new batch analysis from scratch", className="text-muted mb-3"),
-                        dbc.Button("New Batch", color="success", className="me-2"),
-                        dbc.Button("Template", color="info")
-                    ], width=6),
-                    
-                    dbc.Col([
-                        html.H6("Batch Settings", className="mb-3"),
-                        html.Div(id='new-batch-info', children="Configure your new batch"),
-                        html.Hr(),
-                        html.H6("Templates:", className="mt-3"),
-                        html.Div(id='templates', children="Available templates")
-                    ], width=6)
-                ])
-            ]
-        return dash.no_update
-    
-    # Callback for save action button
-    @app.callback(
-        dash.dependencies.Output('action-tab-content', 'children', allow_duplicate=True),
-        [dash.dependencies.Input('save-action-btn', 'n_clicks')],
+                style('load-action-btn'),
+                style('new-action-btn'),
+                style('save-action-btn'),
+                {display: 'none'}
+            ];
+        }
+        """,
+        [dash.dependencies.Output('load-container', 'style'),
+         dash.dependencies.Output('new-container', 'style'),
+         dash.dependencies.Output('save-container', 'style'),
+         dash.dependencies.Output('action-tab-content', 'style')],
+        [dash.dependencies.Input('load-action-btn', 'n_clicks'),
+         dash.dependencies.Input('new-action-btn', 'n_clicks'),
+         dash.dependencies.Input('save-action-btn', 'n_clicks')],
         prevent_initial_call=True
     )
-    def update_save_content(n_clicks):
-        """Update content for save action"""
-        if n_clicks:
-            return [
-                dbc.Row([
-                    dbc.Col([
-                        html.H6("Save Batch", className="mb-3"),
-                        html.P("Save your current batch analysis", className="text-muted mb-3"),
-                        dbc.Button("Save As", color="info", className="me-2"),
-                        dbc.Button("Export", color="warning")
-                    ], width=6),
-                    
-                    dbc.Col([
-                        html.H6("Export Options", className="mb-3"),
-                        html.Div(id='save-options', children="Choose export format"),
-                        html.Hr(),
-                        html.H6("Recent Saves:", className="mt-3"),
-                        html.Div(id='recent-saves', children="No recent saves")
-                    ], width=6)
-                ])
-            ]
-        return dash.no_update
     
     def save_file(name, contents):
         """
@@ -342,7 +349,7 @@ def register_callbacks(app):
         """
 
         UPLOAD_DIRECTORY = tempfile.gettempdir()
-        data = contents.encode("utf8").split(b";base64,")[1]
+        data = contents.partition(";base64,")[2].encode("utf8")
         
         # Use os.path.join to create a full server-side path
         server_path = os.path.join(UPLOAD_DIRECTORY, name)
@@ -364,32 +371,26 @@ def register_callbacks(app):
     )
     def handle_file_upload(contents, filename):
         """Handle .ini file upload"""
-        if contents is not None:
-            # File was selected - capture full file path
-            full_path = save_file(filename, contents)          
-            
-            # Use global data storage
-            data_storage = get_data_storage()
-            try:
-                decoded = base64.b64decode(contents.split(',')[1]).decode('utf-8')
-                config = configparser.ConfigParser()
-                config.read_string(decoded)
-                config_dict = {}
-                for section in config.sections():
-                    config_dict[section] = dict(config[section])
-                add_data('parsed_config', config_dict)
-            except Exception as e:
-                add_data('parsed_config', {"error": f"Failed to parse INI file: {str(e)}"})
-            
-            # Create form with INI config content
-            parsed_config = data_storage.get('parsed_config', {})
-            if parsed_config and "error" not in parsed_config:
-                form_content = create_ini_config_form(parsed_config, filename, full_path)
-            else:
-                form_content = f"Error loading INI file: {parsed_config.get('error', 'Unknown error')}"
-            
-            return form_content
-        return "No file selected"
+        if contents is None:
+            raise PreventUpdate
+        # File was selected - capture full file path
+        full_path = save_file(filename, contents)          
+
+        # Use global data storage
+        data_storage = get_data_storage()
+        try:
+            add_data('parsed_config', _parse_ini_contents(contents))
+        except Exception as e:
+            add_data('parsed_config', {"error": f"Failed to parse INI file: {str(e)}"})
+
+        # Create form with INI config content
+        parsed_config = data_storage.get('parsed_config', {})
+        if parsed_config and "error" not in parsed_config:
+            form_content = create_ini_config_form(parsed_config, filename, full_path)
+        else:
+            form_content = f"Error loading INI file: {parsed_config.get('error', 'Unknown error')}"
+
+        return form_content
     
     # Callback to auto-update Batch Table when INI file is loaded
     @app.callback(
@@ -401,17 +402,12 @@ def register_callbacks(app):
     def auto_update_batch_table(contents, filename):
         """Auto-update batch table when INI file is loaded"""
         if contents is None:
-            return "No batch data loaded"
+            raise PreventUpdate
         
         # Load CSV data directly in this callback to avoid timing issues
         try:
             # Parse INI file
-            decoded = base64.b64decode(contents.split(',')[1]).decode('utf-8')
-            config = configparser.ConfigParser()
-            config.read_string(decoded)
-            config_dict = {}
-            for section in config.sections():
-                config_dict[section] = dict(config[section])
+            config_dict = _parse_ini_contents(contents)
             
             # Check for batch_data_file in Input Info section
             if "Input Info" in config_dict:
@@ -433,28 +429,23 @@ def register_callbacks(app):
                         df = pd.read_csv(csv_path)
                         # Store in global storage for other callbacks
                         add_data('csv_batch_data', df)
+                        # drop test ids cached for the previous table
+                        get_data_storage().pop('_cached_df_id', None)
                         add_data('csv_filename', os.path.basename(csv_path))
                         return create_csv_table(df, os.path.basename(csv_path))
                     else:
-                        return html.Div([
-                            html.H6("CSV file not found", className="text-warning"),
-                            html.P(f"Could not find CSV file at: {csv_path}")
-                        ])
+                        return _batch_table_notice(
+                            "CSV file not found",
+                            f"Could not find CSV file at: {csv_path}"
+                        )
                 else:
-                    return html.Div([
-                        html.H6("No batch_data_file found", className="text-warning"),
-                        html.P("The INI file does not contain a 'batch_data_file' key in the 'Input Info' section")
-                    ])
+                    return _NO_BATCH_DATA_FILE_NOTICE
             else:
-                return html.Div([
-                    html.H6("No Input Info section found", className="text-warning"),
-                    html.P("The INI file does not contain an 'Input Info' section")
-                ])
+                return _NO_INPUT_INFO_NOTICE
         except Exception as e:
-            return html.Div([
-                html.H6("Error loading data", className="text-danger"),
-                html.P(f"Error: {str(e)}")
-            ])
+            return _batch_table_notice(
+                "Error loading data", f"Error: {str(e)}", level="danger"
+            )
     
     
     # Callback for column search functionality
@@ -495,75 +486,46 @@ def register_callbacks(app):
         filename = data_storage.get('csv_filename', 'Unknown')
         
         if not selected_columns:
-            selected_columns = df.columns[:10].tolist() if len(df.columns) > 10 else df.columns.tolist()
-        
-        # Create table with selected columns
-        table_data = [{
-            'type': 'table',
-            'header': {
-                'values': selected_columns,
-                'fill': {'color': '#007bff'},
-                'font': {'color': 'white', 'size': 12}
-            },
-            'cells': {
-                'values': [df[col].tolist() for col in selected_columns],
-                'fill': {'color': ['#f8f9fa', 'white']},
-                'font': {'size': 11},
-                'height': 30
-            }
-        }]
+            selected_columns = list(islice(df.columns, 10))
         
-        return {
-            'data': table_data,
-            'layout': {
-                'title': f'Batch Data: {filename} (Showing {len(selected_columns)} of {len(df.columns)} columns)',
-                'height': min(600, 200 + len(df) * 30),
-                'margin': {'l': 10, 'r': 10, 't': 50, 'b': 10}
-            }
-        }
-    
-    # Callback for select all columns button
-    @app.callback(
-        dash.dependencies.Output('column-selector', 'value', allow_duplicate=True),
-        [dash.dependencies.Input('select-all-cols', 'n_clicks')],
-        prevent_initial_call=True
-    )
-    def select_all_columns(n_clicks):
-        """Select all columns when button is clicked"""
-        if n_clicks:
-            data_storage = get_data_storage()
-            if 'csv_batch_data' in data_storage and data_storage['csv_batch_data'] is not None:
-                return data_storage['csv_batch_data'].columns.tolist()
-        return dash.no_update
-    
-    # Callback for clear all columns button
-    @app.callback(
-        dash.dependencies.Output('column-selector', 'value', allow_duplicate=True),
-        [dash.dependencies.Input('clear-all-cols', 'n_clicks')],
-        prevent_initial_call=True
-    )
-    def clear_all_columns(n_clicks):
-        """Clear all column selections when button is clicked"""
-        if n_clicks:
-            return []
-        return dash.no_update
+        # Create table with selected columns, reusing figures already built
+        # for this table (reset view and select all repeat the same selections)
+        cached = data_storage.get('_table_figures')
+        if cached is None or cached[0] is not df:
+            cached = (df, {})
+            data_storage['_table_figures'] = cached
+        figures = cached[1]
+        key = (tuple(selected_columns), filename)
+        figure = figures.get(key)
+        if figure is None:
+            figure = _table_figure(df, selected_columns, filename)
+            if len(figures) >= _TABLE_FIGURE_CACHE_SIZE:
+                figures.pop(next(iter(figures)))
+            figures[key] = figure
+        return figure
     
-    # Callback for reset view button
+    # Callback for the select all / clear all / reset view buttons
     @app.callback(
-        [dash.dependencies.Output('column-selector', 'value', allow_duplicate=True),
-         dash.dependencies.Output('column-search', 'value', allow_duplicate=True)],
-        [dash.dependencies.Input('reset-view', 'n_clicks')],
+        [dash.dependencies.Output('column-selector', 'value'),
+         dash.dependencies.Output('column-search', 'value')],
+        [dash.dependencies.Input('select-all-cols', 'n_clicks'),
+         dash.dependencies.Input('clear-all-cols', 'n_clicks'),
+         dash.dependencies.Input('reset-view', 'n_clicks')],
         prevent_initial_call=True
     )
-    def reset_table_view(n_clicks):
-        """Reset table view to show first 10 columns"""
-        if n_clicks:
-            data_storage = get_data_storage()
-            if 'csv_batch_data' in data_storage and data_storage['csv_batch_data'] is not None:
-                df = data_storage['csv_batch_data']
-                initial_cols = df.columns[:10].tolist() if len(df.columns) > 10 else df.columns.tolist()
-                return initial_cols, ""
-        return dash.no_update, dash.no_update
+    def update_column_selection(_n_select, _n_clear, _n_reset):
+        """Select all, clear, or reset to the first 10 columns, per the button clicked"""
+        button = dash.ctx.triggered_id
+        if button == 'clear-all-cols':
+            return [], dash.no_update
+        df = get_data_storage().get('csv_batch_data')
+        if df is None:
+            raise PreventUpdate
+        if button == 'select-all-cols':
+            return df.columns.tolist(), dash.no_update
+        if button == 'reset-view':
+            return list(islice(df.columns, 10)), ""
+        raise PreventUpdate
     
     # Register analysis callbacks
     register_analysis_callbacks(app)
@@ -4,17 +4,15 @@ Dashboard Layout Components
 Contains all layout components for the Batch Slug Test Analysis dashboard.
 """
 
+import dash
 import dash_bootstrap_components as dbc
 from dash import html, dcc
-import base64
 
 def get_logo():
-    """Get logo as base64"""
+    """Get the logo URL served from the app's assets folder"""
     try:
-        with open('assets/logo.png', 'rb') as f:
-            logo_b64 = base64.b64encode(f.read()).decode()
-        return f"data:image/png;base64,{logo_b64}"
-    except:
+        return dash.get_asset_url("logo.png")
+    except Exception:
         return "💧"  # Fallback to emoji
 
 def create_header():
@@ -48,6 +46,104 @@ def create_header():
         
     ], style={"display": "flex", "alignItems": "center", "backgroundColor": "#f8f9fa"})
 
+def create_load_panel():
+    """Create the Load action panel, hidden until the Load button is clicked"""
+    return html.Div(id="load-container", style={"display": "none"}, children=[
+        dbc.Row([
+            dbc.Col([
+                html.H6("Load Batch File", className="mb-3"),
+                html.P("Select and load an existing batch file for analysis", className="text-muted mb-3"),
+
+                # Direct file input - no Choose File button needed
+                dcc.Upload(
+                    id="file-input",
+                    children=html.Div([
+                        html.A('📁 Choose .ini File', 
+                               style={'color': 'white', 'textDecoration': 'none', 'fontWeight': 'bold', 'fontSize': '16px'})
+                    ], style={'padding': '12px 24px', 'backgroundColor': '#007bff', 'borderRadius': '6px', 'cursor': 'pointer', 'display': 'inline-block', 'border': 'none', 'textAlign': 'center'}),
+                    style={"display": "block", "margin": "10px 0"},
+                    accept=".ini",
+                    multiple=False
+                ),
+
+                html.Hr(),
+                html.H6("File Details", className="mb-3"),
+                dbc.Tabs([
+                    dbc.Tab(
+                        label="Settings File Details",
+                        tab_id="settings-tab",
+                        children=[
+                            html.Div(id='load-file-info', children="No file selected")
+                        ]
+                    ),
+                    dbc.Tab(
+                        label="Batch Table",
+                        tab_id="batch-table-tab",
+                        children=[
+                            html.Div([
+                                html.H6("Batch Data Table", className="mb-3"),
+                                html.P("CSV data will be automatically loaded from the INI file configuration", className="text-muted mb-3"),
+                                html.Div(id='batch-table-info', children="No batch data loaded")
+                            ])
+                        ]
+                    )
+                ], id="file-details-tabs", active_tab="settings-tab"),
+                html.Hr(),
+                html.H6("Recent Files:", className="mt-3"),
+                html.Div(id='recent-files', children="No recent files")
+            ], width=12)
+        ])
+    ])
+
+def _make_action_panel(panel_id, title, subtitle, buttons, side_title, side_info,
+                       list_title, list_info):
+    """Create a hidden two-column action panel.
+
+    The left column holds the title, subtitle and buttons; the right column
+    holds two placeholder divs, given as (id, text) pairs, under their headings.
+    """
+    return html.Div(id=panel_id, style={"display": "none"}, children=[
+        dbc.Row([
+            dbc.Col([
+                html.H6(title, className="mb-3"),
+                html.P(subtitle, className="text-muted mb-3"),
+                *buttons
+            ], width=6),
+
+            dbc.Col([
+                html.H6(side_title, className="mb-3"),
+                html.Div(id=side_info[0], children=side_info[1]),
+                html.Hr(),
+                html.H6(list_title, className="mt-3"),
+                html.Div(id=list_info[0], children=list_info[1])
+            ], width=6)
+        ])
+    ])
+
+def create_new_panel():
+    """Create the New action panel, hidden until the New button is clicked"""
+    return _make_action_panel(
+        "new-container",
+        "Create New Batch",
+        "Start a new batch analysis from scratch",
+        [dbc.Button("New Batch", color="success", className="me-2"),
+         dbc.Button("Template", color="info")],
+        "Batch Settings", ('new-batch-info', "Configure your new batch"),
+        "Templates:", ('templates', "Available templates"),
+    )
+
+def create_save_panel():
+    """Create the Save action panel, hidden until the Save button is clicked"""
+    return _make_action_panel(
+        "save-container",
+        "Save Batch",
+        "Save your current batch analysis",
+        [dbc.Button("Save As", color="info", className="me-2"),
+         dbc.Button("Export", color="warning")],
+        "Export Options", ('save-options', "Choose export format"),
+        "Recent Saves:", ('recent-saves', "No recent saves"),
+    )
+
 def create_upload_tab():
     """Create the data upload tab content"""
     return dbc.Tab(
@@ -106,27 +202,12 @@ def create_upload_tab():
                     dbc.Col([
                         dbc.Card([
                             dbc.CardBody([
-                                # Tab content
-                                html.Div(id="action-tab-content", children=[
-                                    # Status section
-                                    dbc.Row([
-                                        dbc.Col([
-                                            html.H6("Status", className="mb-3"),
-                                            html.Div(id='upload-status', children="No batch file loaded"),
-                                            html.Hr(),
-                                            html.H6("Recent Actions:", className="mt-3"),
-                                            html.Div(id='action-log', children="No actions yet")
-                                        ], width=6),
-                                        
-                                        dbc.Col([
-                                            html.H6("File Information", className="mb-3"),
-                                            html.Div(id='file-info', children="No files selected"),
-                                            html.Hr(),
-                                            html.H6("Analysis Options:", className="mt-3"),
-                                            html.Div(id='analysis-options', children="Select files to see options")
-                                        ], width=6)
-                                    ])
-                                ]),
+                                # Tab content: a placeholder until an action button
+                                # reveals its panel
+                                html.Div(id="action-tab-content", children="Select an action"),
+                                create_load_panel(),
+                                create_new_panel(),
+                                create_save_panel(),
                                 
                             ])
                         ])
@@ -151,6 +232,8 @@ def create_analysis_tab():
                     n_intervals=0,
                     disabled=True
                 ),
+                # Batch progress polled on each interval tick
+                dcc.Store(id="batch-progress-store"),
                 html.H2("Slug Test Analysis", className="mb-4"),
                 html.P("Select tests and run analysis on your slug test data", className="text-muted mb-4"),
                 
@@ -162,6 +245,8 @@ def create_analysis_tab():
 
                 # Test Selection Card (dynamically created)
                 html.Div(id="test-selection-card"),
+                # Test ids of the loaded batch; the dropdown options are built from it
+                dcc.Store(id="test-ids-store"),
                 
                 # Analysis Status
                 html.Div(id="analysis-status", className="mb-4")
@@ -4,15 +4,15 @@ Results Tab Callbacks
 Callbacks specifically for the Results tab functionality.
 """
 import os
-import pandas as pd
 import dash
-from dash import html, dcc
+from dash import html
 import base64
 import dash_bootstrap_components as dbc
 import pandas as pd
 from .data_storage import get_data_storage
 from .components import create_results_table
 from .data_storage import add_data
+from .analysis_callbacks import get_unique_test_ids
 
 
 def register_results_callbacks(app):
@@ -25,17 +25,10 @@ def register_results_callbacks(app):
     )
     def populate_results_selector(_batch_children):
         """Populate the Results tab dropdown with test_id options."""
-        data_storage = get_data_storage()
-        df = data_storage.get('csv_batch_data')
-        if df is None:
-            return []
-        if 'field' not in df.columns:
-            return []
-        df_t = df.set_index('field').transpose()
-        if 'test_id' not in df_t.columns:
-            return []
-        unique_tests = df_t['test_id'].unique().tolist()
-        return [{"label": str(t), "value": str(t)} for t in unique_tests]
+        # shares the per-table cache of the analysis tab, so the column
+        # checks and the id scan run once per loaded batch table
+        unique_tests = get_unique_test_ids(get_data_storage())
+        return [{"label": s, "value": s} for s in map(str, unique_tests)]
 
     # Do not auto-select a default test; require explicit user selection
 
@@ -81,16 +74,17 @@ def register_results_callbacks(app):
             batch_obj = data_storage.get('batch_obj')
             if batch_obj is not None and hasattr(batch_obj, 'df_batch'):
                 df_batch = batch_obj.df_batch
-                test_file = df_batch.loc[df_batch["test_id"] == selected_test_id, "test_data_file"].values[0]
+                # filter the batch once; scalar cells are then read with iat
+                test_info = df_batch[df_batch["test_id"] == selected_test_id]
+                test_file = test_info["test_data_file"].iat[0]
                 test_file = os.path.basename(test_file)
                 test_file = os.path.splitext(test_file)[0] + ".png"
                 recovery_fn = os.path.join(output_folder, 'recovery_splits', test_file)
-                test_info = df_batch[df_batch["test_id"] == selected_test_id]
                 test_results = batch_obj.df_results[batch_obj.df_results["test_name"] == selected_test_id]
-                K_est = test_results["hydraulic_conductivity"].values[0] * 24 * 60 * 60
+                K_est = test_results["hydraulic_conductivity"].iat[0] * 24 * 60 * 60
                 K_est = round(K_est, 2)
 
-                T_est = test_results["transmissivity"].values[0] * 24 * 60 * 60
+                T_est = test_results["transmissivity"].iat[0] * 24 * 60 * 60
                 T_est = round(T_est, 2)
 
                 # get all columns in test_results except test_name, hydraulic_conductivity, transmissivity. and create a table below the estimated parameters card
@@ -286,39 +280,38 @@ def register_results_callbacks(app):
             dismissable=False,
         )
 
-    @app.callback(
+    # The summary only needs the batch table shape, which the analysis tab
+    # already puts in test-ids-store, so it is rendered in the browser
+    app.clientside_callback(
+        """
+        function(nClicksBatch, selectedResultTest, data) {
+            if (!nClicksBatch) { return ""; }
+            if (!data || !data.shape) {
+                return {
+                    namespace: "dash_bootstrap_components",
+                    type: "Alert",
+                    props: {children: "No data available to summarize.", color: "secondary"}
+                };
+            }
+            const chosen = selectedResultTest ? selectedResultTest : "None";
+            const item = text => ({namespace: "dash_html_components", type: "Li", props: {children: text}});
+            return {
+                namespace: "dash_html_components",
+                type: "Ul",
+                props: {children: [
+                    item(`Rows: ${data.shape[0]}`),
+                    item(`Columns: ${data.shape[1]}`),
+                    item(`Results selection: ${chosen}`)
+                ]}
+            };
+        }
+        """,
         dash.dependencies.Output("summary-stats", "children"),
         [dash.dependencies.Input("run-batch-btn", "n_clicks"),
          dash.dependencies.Input('results-test-selector', 'value')],
+        [dash.dependencies.State('test-ids-store', 'data')],
         prevent_initial_call=True,
-    )
-    def update_summary_stats(n_clicks_batch, selected_result_test):
-        """Update the summary stats when analysis runs."""
-        if not n_clicks_batch:
-            return ""
-
-        data_storage = get_data_storage()
-
-        # If a processed results frame exists, summarize it; otherwise show
-        # a helpful placeholder.
-        df = data_storage.get("csv_batch_data")
-        if df is None:
-            return dbc.Alert(
-                "No data available to summarize.", color="secondary"
-            )
-
-        num_rows = len(df)
-        num_cols = len(df.columns)
-        chosen = selected_result_test if selected_result_test else "None"
-
-        return html.Ul(
-            [
-                html.Li(f"Rows: {num_rows}"),
-                html.Li(f"Columns: {num_cols}"),
-                html.Li(f"Results selection: {chosen}"),
-            ]
-        )
-    
+    )    
  
 
     # @app.callback(
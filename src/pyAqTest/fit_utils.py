@@ -152,6 +152,7 @@ def fit_regression(
     loss: str = 'linear',
     f_scale: float = 1.0,
     max_nfev: Optional[int] = None,
+    jac: Optional[Callable] = None,
 ):
     """
     Fit linear or non-linear models to data with optional robust loss.
@@ -168,6 +169,8 @@ def fit_regression(
       Only used for non-linear robust fitting.
     - f_scale: scaling for robust loss in least_squares.
     - max_nfev: max function evaluations (least_squares) / maxfev (curve_fit).
+    - jac: callable like jac(x, *params) returning the (n, n_params) derivatives
+      of the model. Finite differences are used when not given.
 
     Returns:
     - SimpleNamespace with fields including:
@@ -290,8 +293,14 @@ def fit_regression(
                 def residual_fn(p):
                     return y - np.asarray(model(x, *p))
 
+                if jac is not None:
+                    def residual_jac(p):
+                        return -np.asarray(jac(x, *p))
+                else:
+                    residual_jac = '2-point'
+
                 lsq = least_squares(
-                    residual_fn, x0=p0, bounds=bounds,
+                    residual_fn, x0=p0, jac=residual_jac, bounds=bounds,
                     loss=robust_method if robust_method else loss,
                     f_scale=f_scale, max_nfev=max_nfev
                 )
@@ -334,7 +343,7 @@ def fit_regression(
         # Default non-robust -> curve_fit
         else:
             try:
-                popt, pcov = curve_fit(model, x, y, p0=p0, bounds=bounds) 
+                popt, pcov = curve_fit(model, x, y, p0=p0, bounds=bounds, jac=jac)
                 y_pred = np.asarray(model(x, *popt))
                 num_params = len(popt)
                 stats = _compute_basic_fit_stats(y, y_pred, num_predictors=num_params)
@@ -11,11 +11,19 @@ class Batch_Settings:
         self.time_unit = "s"
         self.time_col = "Time"
         self.head_col = "Head"
+        # format of the time column in the processed test data files
+        self.time_format = "ISO8601"
         extract_recovery = True
 
         self.log_file = "logging.log"
         self.output_folder = r"output"
         # self.processed_data_folder = "processed_data"
+        # number of worker processes used to analyze batch tests; values
+        # above 1 need the calling script to guard its entry point with
+        # ``if __name__ == "__main__":`` on platforms that spawn workers
+        self.max_workers = 1
+        # re-convert raw test files even if their processed CSV is up to date
+        self.force_conversion = False
 
         self.test_id_col = "test_id"
         self.test_type_col = "test_type"
@@ -69,6 +77,7 @@ class Batch_Settings:
             "batch_data_file": self.batch_data_file,
             "time_col": self.time_col,
             "head_col": self.head_col,
+            "time_format": self.time_format,
         }
 
         config["Output Info"] = {
@@ -18,6 +18,18 @@ from pyAqTest import AquiferTestBase
 from pyAqTest.utils import evaluate_regression_fit, harmonize_units, get_static_level
 from pyAqTest.fit_utils import fit_regression
 
+# the Butler model kernel is compiled with numba when it is installed
+try:
+    from numba import njit as _njit
+except ImportError:
+
+    def _njit(*args, **kwargs):
+        return lambda func: func
+
+
+# units accepted by the slug test input checks
+_VALID_LENGTH_UNITS = frozenset(("m", "ft"))
+_VALID_TIME_UNITS = frozenset(("s", "min", "hr"))
 
 # Slug fit figure styling (batch PNGs / compare PDFs).
 _SLUG_FIT_FIGSIZE = (7.0, 5.0)
@@ -104,6 +116,60 @@ def _draw_slug_fit_reference_annotations(
             zorder=5,
         )
 
+@_njit(cache=True)
+def _butler_response(t, Cd, mod_factor):
+    """Normalized head response of the Butler (2003) model for dimensionless damping Cd."""
+    omg = np.sqrt(abs(1 - (Cd / 2) ** 2))
+    omg_pos = -Cd / 2 + omg
+    omg_neg = -Cd / 2 - omg
+    t_adj = t * mod_factor
+    if Cd > 2:
+        wd = (1 / (omg_neg - omg_pos)) * (
+            omg_neg * np.exp(omg_pos * t_adj) - omg_pos * np.exp(omg_neg * t_adj)
+        )
+    elif Cd == 2:
+        wd = np.exp(-t_adj) * (1 + t_adj)
+    else:
+        wd = np.exp(-Cd * t_adj / 2) * (
+            np.cos(omg * t_adj) + (Cd / (2 * omg)) * np.sin(omg * t_adj)
+        )
+    return wd
+
+
+@_njit(cache=True)
+def _butler_jacobian(t, Cd, mod_factor):
+    """
+    Derivatives of _butler_response with respect to Cd and mod_factor.
+
+    The response w solves w'' + Cd w' + w = 0 in adjusted time, so dw/dCd
+    is the self-convolution of the impulse response h = -w'.
+    """
+    a = Cd / 2
+    t_adj = t * mod_factor
+    if Cd > 2:
+        q = np.sqrt(a * a - 1)
+        beta = 2 * q
+        e_pos = np.exp((-a + q) * t_adj)
+        e_neg = np.exp((-a - q) * t_adj)
+        h = (e_pos - e_neg) / beta
+        d_cd = (t_adj * (e_pos + e_neg) - 2 * (e_pos - e_neg) / beta) / beta**2
+    elif Cd == 2:
+        e = np.exp(-t_adj)
+        h = t_adj * e
+        d_cd = e * t_adj**3 / 6
+    else:
+        omg = np.sqrt(1 - a * a)
+        e = np.exp(-a * t_adj)
+        h = e * np.sin(omg * t_adj) / omg
+        d_cd = e * (np.sin(omg * t_adj) - omg * t_adj * np.cos(omg * t_adj)) / (
+            2 * omg**3
+        )
+    jac = np.empty((t.size, 2))
+    jac[:, 0] = d_cd
+    jac[:, 1] = -t * h
+    return jac
+
+
 def catch_data_issues(aq_typ, screen_top_depth, b, B,  water_table_depth):
             if b > B: # this can happen if the screen length is greater than the aquifer thickness
                 #print(f"Warning: Screen length is greater than the aquifer thickness for test")
@@ -208,9 +274,9 @@ class Bouwer_Rice_1976(AquiferTestBase):
             raise ValueError("Casing radius must be greater than zero.")
 
         # check length and time units
-        if self.slug_well.length_unit not in ["m", "ft"]:
+        if self.slug_well.length_unit not in _VALID_LENGTH_UNITS:
             raise ValueError("Length unit must be either 'm' or 'ft'.")
-        if self.slug_well.time_unit not in ["s", "min", "hr"]:
+        if self.slug_well.time_unit not in _VALID_TIME_UNITS:
             raise ValueError("Time unit must be either 's', 'min', or 'hr'.")
 
     def isolate_recovery(self, time, head, window_size=10):
@@ -491,30 +557,15 @@ class Butler_2003(AquiferTestBase):
             raise ValueError("Casing radius must be greater than zero.")
 
     def model(self, t, Cd, mod_factor):
-
-        # ==========================
         # alpha is Cd
-        if self.slug_well.length_unit == "m":
-            g = 9.81  # time always in seconds
-        else:
-            g = 32.174
-        # =============================
-        omg = np.sqrt(abs(1 - (Cd / 2) ** 2))
-        omg_pos = -Cd / 2 + np.sqrt(abs(1 - (Cd / 2) ** 2))
-        omg_neg = -Cd / 2 - np.sqrt(abs(1 - (Cd / 2) ** 2))
-        t_adj = t * mod_factor
-        if Cd > 2:
-            wd = (1 / (omg_neg - omg_pos)) * (
-                omg_neg * np.exp(omg_pos * t_adj) - omg_pos * np.exp(omg_neg * t_adj)
-            )
-        elif Cd == 2:
-            wd = np.exp(-t_adj) * (1 + t_adj)
-        else:
-            wd = np.exp(-Cd * t_adj / 2) * (
-                np.cos(omg * t_adj) + (Cd / (2 * omg)) * np.sin(omg * t_adj)
-            )
+        return _butler_response(
+            np.ascontiguousarray(t, dtype=np.float64), float(Cd), float(mod_factor)
+        )
 
-        return wd
+    def jacobian(self, t, Cd, mod_factor):
+        return _butler_jacobian(
+            np.ascontiguousarray(t, dtype=np.float64), float(Cd), float(mod_factor)
+        )
 
     def fit(self, xdata, ydata, p0):
         # Use self.model — it's already bound to self
@@ -599,6 +650,7 @@ class Butler_2003(AquiferTestBase):
                     h_normalized,
                     method="nonlinear",
                     model=self.model,
+                    jac=self.jacobian,
                     p0=[1.99, 1.0],
                     bounds=([minV, minV], [maxV,maxV]),
                 )
@@ -127,6 +127,23 @@ def insitu_to_csv(
             print(f"  Error processing file: {slug_file} ")
 
 
+def _list_slug_files(input_folder, skip_word, file_extension):
+    """
+    Names of the files in input_folder with file_extension and without skip_word.
+    The extension is matched case-insensitively, so '.HTM' files are found too.
+    """
+    file_extension = file_extension.lower()
+    # a single scandir pass; DirEntry.is_file needs no extra stat on most platforms
+    with os.scandir(input_folder) as entries:
+        return [
+            entry.name
+            for entry in entries
+            if entry.is_file()
+            and skip_word not in entry.name
+            and entry.name.lower().endswith(file_extension)
+        ]
+
+
 def in_situ_tests_to_csv(
     input_folder: str,
     output_folder: str,
@@ -143,9 +160,7 @@ def in_situ_tests_to_csv(
     """
 
     # 1) Get the files with slug data
-    slug_files = os.listdir(input_folder)
-    slug_files = [f for f in slug_files if skip_word not in f]
-    slug_files = [f for f in slug_files if f.endswith(file_extension)]
+    slug_files = _list_slug_files(input_folder, skip_word, file_extension)
 
     # 2) Read the data from each file
     for slug_file in tqdm(slug_files, desc="Processing files"):
@@ -198,9 +213,7 @@ def extract_well_name(text):
 def rename_htm_files(input_folder, output_folder, file_extension, skip_word):
     # 1) Get the files with slug data
     # todo: handle T1 and T2
-    slug_files = os.listdir(input_folder)
-    slug_files = [f for f in slug_files if skip_word not in f]
-    slug_files = [f for f in slug_files if f.endswith(file_extension)]
+    slug_files = _list_slug_files(input_folder, skip_word, file_extension)
 
     for file in slug_files:
         if "WET" in file or "wet" in file:
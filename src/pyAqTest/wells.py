@@ -16,6 +16,8 @@ import pandas as pd
 import numpy as np
 
 VALID_WELL_TYPES = ["pumping", "slug", "observation"]
+VALID_LENGTH_UNITS = frozenset(("m", "ft"))
+VALID_TIME_UNITS = frozenset(("s", "min", "h"))
 
 
 class Well:
@@ -122,12 +124,12 @@ class Well:
         return None
 
     def validate_length_and_time_units(self) -> Union[None, str]:
-        if self.length_unit not in ["m", "ft"]:
+        if self.length_unit not in VALID_LENGTH_UNITS:
             return (
                 f"Error: Invalid length unit '{self.length_unit}'. "
                 f"Must be 'm' or 'ft'."
             )
-        if self.time_unit not in ["s", "min", "h"]:
+        if self.time_unit not in VALID_TIME_UNITS:
             return (
                 f"Error: Invalid time unit '{self.time_unit}'. "
                 f"Must be 's', 'min', or 'h'."
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+import pandas as pd
+from pyAqTest.aquifer import Aquifer
+
+
+def make_aquifer(**kwargs):
+    params = dict(
+        name="A1",
+        aquifer_type="unconfined",
+        ground_surface_elevation=100.0,
+        saturated_thickness=20.0,
+        water_table_depth=5.0,
+        specific_yield=0.2,
+        specific_storage=1e-4,
+        length_unit="m",
+        time_unit="s",
+    )
+    params.update(kwargs)
+    return Aquifer(**params)
+
+
+def test_storage_coefficient_unconfined():
+    aq = make_aquifer()
+    assert aq.storage_coefficient == pytest.approx(0.2 * 20.0)
+
+
+def test_storage_coefficient_confined():
+    aq = make_aquifer(aquifer_type="confined")
+    assert aq.storage_coefficient == pytest.approx(1e-4 * 20.0)
+
+
+def test_numpy_str_aquifer_type():
+    aq = make_aquifer(aquifer_type=np.str_("confined"))
+    assert aq.aquifer_type == "confined"
+    assert type(aq.aquifer_type) is str
+    assert aq.storage_coefficient == pytest.approx(1e-4 * 20.0)
+
+
+def test_storage_coefficient_missing_input():
+    aq = make_aquifer(specific_yield=None)
+    assert aq.storage_coefficient is None
+
+
+def test_storage_coefficient_invalidated_on_input_change():
+    aq = make_aquifer()
+    assert aq.storage_coefficient == pytest.approx(4.0)
+    aq.saturated_thickness = 10.0
+    assert aq.storage_coefficient == pytest.approx(2.0)
+    aq.specific_yield = 0.1
+    assert aq.storage_coefficient == pytest.approx(1.0)
+    aq.aquifer_type = "confined"
+    assert aq.storage_coefficient == pytest.approx(1e-3)
+
+
+def test_transmissivity_invalidated_on_input_change():
+    aq = make_aquifer(radial_conductivity=1e-4)
+    assert aq.transmissivity == pytest.approx(2e-3)
+    aq.radial_conductivity = 2e-4
+    assert aq.transmissivity == pytest.approx(4e-3)
+    aq.saturated_thickness = 10.0
+    assert aq.transmissivity == pytest.approx(2e-3)
+
+
+def test_from_dataframe():
+    df = pd.DataFrame(
+        {
+            "name": ["A1", "A2"],
+            "aquifer_type": ["unconfined", "confined"],
+            "ground_surface_elevation": [100.0, 90.0],
+            "saturated_thickness": [20.0, 15.0],
+            "water_table_depth": [5.0, 2.0],
+            "length_unit": ["m", "m"],
+            "time_unit": ["s", "s"],
+        }
+    )
+    aquifers = Aquifer.from_dataframe(df)
+    assert [aq.name for aq in aquifers] == ["A1", "A2"]
+    assert aquifers[1].saturated_thickness == 15.0
+
+    df.loc[1, "saturated_thickness"] = 0.0
+    with pytest.raises(ValueError):
+        Aquifer.from_dataframe(df)
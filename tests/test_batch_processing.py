@@ -1,6 +1,9 @@
 import configparser
+import numpy as np
+import pandas as pd
 import pytest
 from pyAqTest import Batch_Processing
+from pyAqTest.batch_processing import run_batch
 
 
 @pytest.fixture
@@ -53,3 +56,124 @@ def test_init_with_invalid_type():
 def test_from_dict_sets_config(minimal_config_dict):
     bp = Batch_Processing(config_obj=minimal_config_dict)
     assert isinstance(bp.config, configparser.ConfigParser)
+
+
+def _synthetic_slug_test(i):
+    # static level of 10 ft, 2 ft displacement at 30 s, recovering with a
+    # time constant that differs between tests
+    t = np.arange(300)
+    depth = np.full(t.shape, 10.0)
+    recovery = t >= 30
+    depth[recovery] = 10.0 - 2.0 * np.exp(-(t[recovery] - 30) / (15 + 3 * i))
+    times = pd.Timestamp("2023-10-02 11:00:00") + pd.to_timedelta(t, unit="s")
+    return times, depth, recovery
+
+
+def _write_slug_batch(folder, n_tests=2):
+    # synthetic In-Situ exports
+    raw = folder / "raw"
+    raw.mkdir()
+    columns = {}
+    for i in range(n_tests):
+        times, depth, _ = _synthetic_slug_test(i)
+        rows = "".join(
+            f'<tr class="data"><td>{ts:%m/%d/%Y %I:%M:%S %p}</td><td>{d:.5f}</td></tr>'
+            for ts, d in zip(times, depth)
+        )
+        (raw / f"well{i}.htm").write_text(
+            '<html><body><table><tr class="dataHeader"><td>Date Time</td>'
+            f"<td>Depth (ft)</td></tr>{rows}</table></body></html>"
+        )
+        columns[str(i + 1)] = {
+            "test_id": f"T{i}",
+            "test_type": "slug",
+            "aquifer_name": "Aq",
+            "aquifer_type": "unconfined",
+            "aquifer_thickness": 50.0,
+            "water_table_depth": 10.0,
+            "anisotropy": 1.0,
+            "well_name": f"W{i}",
+            "well_radius": 0.1,
+            "casing_radius": 0.05,
+            "screen_length": 5.0,
+            "screen_top_depth": 20.0,
+            "test_data_file": f"well{i}.htm",
+            "slug_volume": "",
+            "solution_method": "Bouwer_Rice" if i % 2 == 0 else "Butler",
+            "ground_surface_elevation": 100.0,
+        }
+    batch = pd.DataFrame(columns)
+    batch.index.name = "field"
+    batch.reset_index().to_csv(folder / "batch.csv", index=False)
+    return raw
+
+
+def test_run_batch_pool_matches_serial(tmp_path):
+    raw = _write_slug_batch(tmp_path)
+    results = {}
+    for max_workers in ("1", "2"):
+        bp = Batch_Processing(
+            config_obj={
+                "Input Info": {
+                    "raw_data_folder": str(raw),
+                    "batch_data_file": str(tmp_path / "batch.csv"),
+                    "length_unit": "ft",
+                    "time_unit": "s",
+                    "max_workers": max_workers,
+                },
+                "Output Info": {"output_folder": str(tmp_path / f"out{max_workers}")},
+            }
+        )
+        bp.run_batch()
+        assert bp.failed_tests == []
+        results[max_workers] = bp.df_results
+    assert len(results["1"]) == 2
+    pd.testing.assert_frame_equal(results["1"], results["2"])
+
+
+def test_module_run_batch_pool_matches_serial(tmp_path):
+    _write_slug_batch(tmp_path)
+    batch = pd.read_csv(tmp_path / "batch.csv").set_index("field").transpose()
+    for i, data_file in enumerate(batch["test_data_file"]):
+        times, depth, recovery = _synthetic_slug_test(i)
+        csv_file = tmp_path / data_file.replace(".htm", ".csv")
+        pd.DataFrame(
+            {"Time": times[recovery].astype(str), "Head": depth[recovery]}
+        ).to_csv(csv_file, index=False)
+        batch.loc[batch.index[i], "test_data_file"] = str(csv_file)
+    results = {
+        max_workers: run_batch(
+            batch, str(tmp_path / f"out{max_workers}"), "s", "ft",
+            max_workers=max_workers,
+        )
+        for max_workers in (1, 2)
+    }
+    assert len(results[1]) == 2
+    pd.testing.assert_frame_equal(results[1], results[2])
+
+
+def test_module_run_batch_reads_time_format_from_config(tmp_path):
+    _write_slug_batch(tmp_path, n_tests=1)
+    batch = pd.read_csv(tmp_path / "batch.csv").set_index("field")
+    times, depth, recovery = _synthetic_slug_test(0)
+    csv_file = tmp_path / "well0.csv"
+    pd.DataFrame(
+        {"Time": times[recovery].strftime("%m/%d/%Y %H:%M:%S"), "Head": depth[recovery]}
+    ).to_csv(csv_file, index=False)
+    batch.loc["test_data_file"] = str(csv_file)
+    batch.reset_index().to_csv(tmp_path / "batch.csv", index=False)
+    config = configparser.ConfigParser()
+    config.read_dict(
+        {
+            "Input Info": {
+                "batch data file": str(tmp_path / "batch.csv"),
+                "time_unit": "s",
+                "length_unit": "ft",
+                # percent signs are doubled, as in an INI file
+                "time_format": "%%m/%%d/%%Y %%H:%%M:%%S",
+            },
+            "Output Info": {"output folder": str(tmp_path / "out")},
+        }
+    )
+    results = run_batch(config_obj=config)
+    assert results["test_name"].tolist() == ["T0"]
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+from pyAqTest.butler import (
+    butler_slug_test_model,
+    estimate_hydraulic_conductivity_butler,
+)
+
+
+def test_estimate_k_recovers_synthetic_curve():
+    # oscillatory recovery of Example 1 in butler.py, without the noise
+    t = np.arange(0, 101, 5, dtype=np.float64)
+    H0, alpha, beta = 1.0, 0.05, 0.2
+    r_c, r_w, L = 0.05, 0.075, 3.0
+    head = butler_slug_test_model(t, H0, alpha, beta)
+
+    result = estimate_hydraulic_conductivity_butler(t, head, r_c, r_w, L)
+
+    K_true = (r_c**2 * alpha) / (2 * r_w * L) * (1 + (beta / alpha) ** 2)
+    assert result["K"] == pytest.approx(K_true, rel=1e-6)
+    assert result["H0_fitted"] == pytest.approx(H0, rel=1e-6)
+    assert result["alpha"] == pytest.approx(alpha, rel=1e-6)
+    assert result["beta"] == pytest.approx(beta, rel=1e-6)
+
+
+def test_estimate_k_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        estimate_hydraulic_conductivity_butler([1, 2], [1], 0.1, 0.15, 2.0)